@@ -15,6 +15,13 @@ from ..flows.main_flows import youtube_pipeline_flow
 from ..models.pipeline import JobStatus, PipelineInput, PipelineResult
 from ..services.model_factory import AIProvider, ModelFactory, TaskType
 
+try:
+    import uvloop  # type: ignore[import-not-found, unused-ignore]
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 app = typer.Typer(
     help="Shepherd Pipeline CLI - AI-powered transcription and summarization"
 )
@@ -288,7 +295,11 @@ def youtube(
             console.print("\n📁 Exporting results...")
             save_transcript_and_summary(result, export_transcript, export_summary)
 
-    asyncio.run(run())
+    # uvloop's faster event loop is used when installed (not on Windows)
+    if UVLOOP_AVAILABLE:
+        uvloop.run(run())
+    else:
+        asyncio.run(run())
 
 
 @app.command()
@@ -311,8 +322,10 @@ def models() -> None:
 
             for model in sorted(models):
                 # Get tasks from model configuration
-                config = ModelFactory.MODEL_CONFIG.get(model, {})
-                supported_tasks = config.get("tasks", [])
+                spec = ModelFactory.MODEL_CONFIG.get(model)
+                supported_tasks = (
+                    [task for task in TaskType if task in spec.tasks] if spec else []
+                )
 
                 # Format task names nicely
                 task_names = []
@@ -10,15 +10,15 @@ from ..models.pipeline import (
     PipelineInput,
     PipelineResult,
 )
+from ..services.model_factory import ModelFactory
 from ..tasks.audio_tasks import (
     chunk_audio,
     download_youtube_audio,
 )
 from ..tasks.summarization_tasks import summarize_text, validate_summary_quality
 from ..tasks.transcription_tasks import (
-    correct_transcriptions_parallel,
     merge_corrected_texts,
-    transcribe_chunks_parallel,
+    transcribe_and_correct_parallel,
 )
 from ..utils.artifact_manager import ArtifactManager
 
@@ -61,24 +61,16 @@ async def youtube_pipeline_flow(
         )
         result.audio_chunks = chunks
 
-        # Step 3: Transcribe chunks
-        logger.info(f"Transcribing {len(chunks)} audio chunks...")
-        transcriptions = await transcribe_chunks_parallel(
+        # Steps 3-4: Transcribe chunks, correcting each as soon as it is ready
+        logger.info(f"Transcribing and correcting {len(chunks)} audio chunks...")
+        transcriptions, corrections = await transcribe_and_correct_parallel(
             chunks,
-            model=pipeline_input.transcription_model,
+            transcription_model=pipeline_input.transcription_model,
+            correction_model=pipeline_input.correction_model,
             language=pipeline_input.target_language,
         )
 
         result.transcriptions = transcriptions
-
-        # Step 4: Correct transcriptions
-        logger.info("Correcting transcriptions...")
-        corrections = await correct_transcriptions_parallel(
-            transcriptions,
-            target_language=pipeline_input.target_language,
-            model=pipeline_input.correction_model,
-        )
-
         result.corrections = corrections
 
         # Step 5: Merge corrected texts
@@ -116,6 +108,7 @@ async def youtube_pipeline_flow(
         result.completed_at = datetime.now(UTC)
 
     finally:
+        await ModelFactory.close_services()
         artifact_manager.remove_chunks(
             audio_metadata, pipeline_input.chunk_size_minutes
         )
@@ -1,12 +1,22 @@
 """Base HTTP service for LLM providers."""
 
+import asyncio
 from pathlib import Path
+import random
 from typing import Any
 
 import httpx
+import orjson
 
 from .schema import BaseLLMService, CorrectionResult, SummaryResult, TranscriptionResult
 
+# Status codes worth retrying; anything else is treated as a permanent error
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Keep enough idle connections alive for a whole job's chunk fan-out, so
+# concurrent requests don't reconnect once httpx's default of 20 is exceeded
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
 
 class BaseHTTPService(BaseLLMService):
     """Base HTTP service with common request handling patterns."""
@@ -15,6 +25,44 @@ class BaseHTTPService(BaseLLMService):
         super().__init__()
         self.api_key = api_key
         self.base_url = base_url
+        self._clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for the running event loop.
+
+        Services are shared across tasks, and Prefect may run tasks on different
+        event loops; an AsyncClient's connections are bound to one loop, so keep
+        one client per loop. aclose() closes them when the work is done.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            self._discard_closed_loops()
+            client = httpx.AsyncClient(limits=HTTP_LIMITS)
+            self._clients[loop] = client
+        return client
+
+    def _discard_closed_loops(self) -> None:
+        """Drop clients whose event loop has closed; they can no longer be used."""
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            del self._clients[loop]
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients of every event loop.
+
+        Each client is closed on the loop that owns its connections. Clients of
+        loops that are no longer running can't be closed that way and are just
+        dropped.
+        """
+        running_loop = asyncio.get_running_loop()
+        clients, self._clients = self._clients, {}
+        for loop, client in clients.items():
+            if loop is running_loop:
+                await client.aclose()
+            elif loop.is_running():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+                )
 
     def _get_auth_headers(self) -> dict[str, str]:
         """Get authentication headers."""
@@ -30,9 +78,10 @@ class BaseHTTPService(BaseLLMService):
         temperature: float = 0.1,
         max_tokens: int | None = None,
         timeout: float = 30.0,
+        prompt_cache_key: str | None = None,
     ) -> dict[str, Any]:
         """Make a chat completion request."""
-        payload = {
+        payload: dict[str, Any] = {
             "model": model,
             "messages": messages,
             "temperature": temperature,
@@ -41,17 +90,71 @@ class BaseHTTPService(BaseLLMService):
         if max_tokens:
             payload["max_tokens"] = max_tokens
 
+        if prompt_cache_key:
+            payload["prompt_cache_key"] = prompt_cache_key
+
         headers = self._get_auth_headers()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                json=payload,
-                headers=headers,
-                timeout=timeout,
-            )
-            response.raise_for_status()
-            return response.json()  # type: ignore[no-any-return]
+        response = await self._post_with_retry(
+            self._get_client(),
+            f"{self.base_url}/chat/completions",
+            content=orjson.dumps(payload),
+            headers=headers,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)  # type: ignore[no-any-return]
+
+    async def _post_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        *,
+        max_attempts: int = 4,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> httpx.Response:
+        """POST with exponential backoff on transport errors, 429 and 5xx.
+
+        The last attempt's response is returned as-is so callers can
+        raise_for_status(), and its transport errors propagate. Only chat
+        requests go through here; audio uploads are sent once and left to the
+        Prefect task retries.
+        """
+        for attempt in range(1, max_attempts):
+            try:
+                response = await client.post(url, **kwargs)
+            except httpx.TransportError as e:
+                delay = self._backoff_delay(attempt)
+                self.logger.warning(
+                    f"Request to {url} failed ({e!r}), retrying in {delay:.1f}s "
+                    f"(attempt {attempt}/{max_attempts})"
+                )
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    return response
+                delay = max(self._retry_after(response), self._backoff_delay(attempt))
+                self.logger.warning(
+                    f"Request to {url} returned {response.status_code}, retrying in "
+                    f"{delay:.1f}s (attempt {attempt}/{max_attempts})"
+                )
+            await asyncio.sleep(delay)
+
+        return await client.post(url, **kwargs)
+
+    @staticmethod
+    def _backoff_delay(
+        attempt: int, initial: float = 0.5, max_delay: float = 10.0
+    ) -> float:
+        """Exponential backoff with up to one second of jitter."""
+        return float(min(initial * 2 ** (attempt - 1) + random.random(), max_delay))
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float:
+        """Seconds requested by a Retry-After header, or 0 if absent/unparseable."""
+        try:
+            return max(float(response.headers.get("Retry-After", 0)), 0.0)
+        except ValueError:
+            return 0.0
 
     async def _make_transcription_request(
         self,
@@ -73,16 +176,15 @@ class BaseHTTPService(BaseLLMService):
                 "response_format": "verbose_json",
             }
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/audio/transcriptions",
-                    headers=headers,
-                    files=files,
-                    data=data,
-                    timeout=timeout,
-                )
-                response.raise_for_status()
-                return response.json()  # type: ignore[no-any-return]
+            response = await self._get_client().post(
+                f"{self.base_url}/audio/transcriptions",
+                headers=headers,
+                files=files,
+                data=data,
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)  # type: ignore[no-any-return]
 
     def _handle_correction_error(
         self,
@@ -152,14 +254,15 @@ class BaseHTTPService(BaseLLMService):
         """Extract detailed error message from exception."""
         if hasattr(error, "response") and error.response is not None:
             try:
-                error_json = error.response.json()
+                error_json = orjson.loads(error.response.content)
                 return f"{error} - Response: {error_json}"
             except Exception:
                 return f"{error} - Status: {error.response.status_code}, Text: {error.response.text[:200]}"
         return str(error)
 
+    @staticmethod
     def _extract_model_from_response(
-        self, response: dict[str, Any], default_model: str
+        response: dict[str, Any], default_model: str
     ) -> str:
         """Extract the actual model used from API response."""
-        return response.get("model", default_model)  # type: ignore[no-any-return]
+        return response.get("model") or default_model
@@ -2,7 +2,7 @@
 
 from ...config.settings import settings
 from .base_http_service import BaseHTTPService
-from .provider_configs import MistralConfig
+from .provider_configs import CORRECTION_TEMPERATURE, MISTRAL_CONFIG, with_word_limit
 from .schema import CorrectionResult, SummaryResult, TranscriptionResult
 
 
@@ -10,7 +10,7 @@ class MistralService(BaseHTTPService):
     """Mistral API service for text correction, summarization, and transcription."""
 
     def __init__(self) -> None:
-        config = MistralConfig()
+        config = MISTRAL_CONFIG
         super().__init__(settings.mistral_api_key, config.base_url)
         self.config = config
 
@@ -62,7 +62,9 @@ class MistralService(BaseHTTPService):
                 {"role": "user", "content": text},
             ]
 
-            result = await self._make_chat_request(messages, model, temperature=0.1)
+            result = await self._make_chat_request(
+                messages, model, temperature=CORRECTION_TEMPERATURE
+            )
             corrected_text = result["choices"][0]["message"]["content"].strip()
             model_used = self._extract_model_from_response(result, model)
 
@@ -89,10 +91,9 @@ class MistralService(BaseHTTPService):
     ) -> SummaryResult:
         """Generate summary using Mistral API."""
         try:
-            system_prompt = instructions or self.config.get_summarization_prompt()
-
-            if word_limit:
-                system_prompt += f"\n\n請將摘要控制在約{word_limit}字以內。"
+            system_prompt = with_word_limit(
+                instructions or self.config.get_summarization_prompt(), word_limit
+            )
 
             messages = [
                 {"role": "system", "content": system_prompt},
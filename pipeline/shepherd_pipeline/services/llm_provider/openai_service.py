@@ -2,7 +2,12 @@
 
 from ...config.settings import settings
 from .base_http_service import BaseHTTPService
-from .provider_configs import OpenAIConfig
+from .provider_configs import (
+    CORRECTION_TEMPERATURE,
+    OPENAI_CONFIG,
+    prompt_cache_key,
+    with_word_limit,
+)
 from .schema import CorrectionResult, SummaryResult, TranscriptionResult
 
 
@@ -10,7 +15,7 @@ class OpenAIService(BaseHTTPService):
     """OpenAI API service for text correction, summarization, and transcription."""
 
     def __init__(self) -> None:
-        config = OpenAIConfig()
+        config = OPENAI_CONFIG
         super().__init__(settings.openai_api_key, config.base_url)
         self.config = config
 
@@ -19,13 +24,19 @@ class OpenAIService(BaseHTTPService):
     ) -> CorrectionResult:
         """Correct and enhance transcribed text using OpenAI API."""
         try:
+            # The static system prompt goes first so its prefix can be cached
+            system_prompt = self.config.get_correction_prompt()
             messages = [
-                {"role": "system", "content": self.config.get_correction_prompt()},
+                {"role": "system", "content": system_prompt},
                 {"role": "user", "content": text},
             ]
 
             result = await self._make_chat_request(
-                messages, model, temperature=0.1, max_tokens=2000
+                messages,
+                model,
+                temperature=CORRECTION_TEMPERATURE,
+                max_tokens=2000,
+                prompt_cache_key=prompt_cache_key(system_prompt),
             )
             corrected_text = result["choices"][0]["message"]["content"].strip()
             model_used = self._extract_model_from_response(result, model)
@@ -53,10 +64,9 @@ class OpenAIService(BaseHTTPService):
     ) -> SummaryResult:
         """Generate summary using OpenAI API."""
         try:
-            system_prompt = instructions or self.config.get_summarization_prompt()
-
-            if word_limit:
-                system_prompt += f"\n\n請將摘要控制在約{word_limit}字以內。"
+            system_prompt = with_word_limit(
+                instructions or self.config.get_summarization_prompt(), word_limit
+            )
 
             messages = [
                 {"role": "system", "content": system_prompt},
@@ -65,7 +75,12 @@ class OpenAIService(BaseHTTPService):
 
             max_tokens = word_limit * 2 if word_limit else 1000
             result = await self._make_chat_request(
-                messages, model, temperature=0.3, max_tokens=max_tokens, timeout=45.0
+                messages,
+                model,
+                temperature=0.3,
+                max_tokens=max_tokens,
+                timeout=45.0,
+                prompt_cache_key=prompt_cache_key(system_prompt),
             )
 
             summary = result["choices"][0]["message"]["content"].strip()
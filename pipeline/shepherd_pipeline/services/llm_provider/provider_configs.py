@@ -1,9 +1,61 @@
 """Provider configuration classes for different LLM providers."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
+from types import MappingProxyType
 from typing import Any
 
+_OPENAI_CORRECTION_PROMPT = """這是一段audio transcription，因為是AI產生了，可能有許多錯字與問題，我需要你把它轉成正確的格式，注意這是基督教的文章或者講道或者見證，所以當你不太確定用語的時候，可以朝這個方向思考。
+
+請修正以下內容：
+1. 修正錯字和語法錯誤
+2. 使用繁體中文（台灣）
+3. 適當的標點符號
+4. 保持基督教用語的準確性
+
+只回傳修正後的文字，不要額外說明。"""
+
+_MISTRAL_CORRECTION_PROMPT = """你是一個很熟悉基督教用語的繁體中文文字編輯，這是一段audio transcription，因為是AI產生了，可能有許多錯字與辨識不出來的問題。請你單純修正錯誤的文字，根據上下文給出最合裡的修訂文字，不要額外說明。"""
+
+_SUMMARIZATION_PROMPT = """請為這段基督教內容製作摘要，重點包括：
+1. 主要的屬靈教導或信息
+2. 重要的聖經引用或原則
+3. 實際的應用或呼籲
+4. 見證或例子的核心要點
+
+請用繁體中文（台灣）回應，保持基督教用語的準確性。"""
+
+# Correction runs greedy so the same text always gets the same correction;
+# correction results are cached on disk on that assumption
+CORRECTION_TEMPERATURE = 0.0
+
+_WORD_LIMIT_SUFFIX = "\n\n請將摘要控制在約{}字以內。"
+
+
+@lru_cache(maxsize=64)
+def with_word_limit(prompt: str, word_limit: int | None) -> str:
+    """Append the summary word-limit instruction to a system prompt.
+
+    Cached because the same prompt/limit pair is rebuilt for every chunk
+    and every retry of a pipeline run.
+    """
+    if not word_limit:
+        return prompt
+    return prompt + _WORD_LIMIT_SUFFIX.format(word_limit)
+
+
+@lru_cache(maxsize=64)
+def prompt_cache_key(system_prompt: str) -> str:
+    """Stable key for OpenAI prompt caching, derived from the system prompt.
+
+    Requests sharing a key are routed to the same cache, so every chunk of a
+    job that starts with the same system prompt can reuse its cached prefix.
+    """
+    return hashlib.sha256(system_prompt.encode()).hexdigest()[:32]
+
 
 @dataclass
 class ProviderConfig(ABC):
@@ -48,27 +100,18 @@ class OpenAIConfig(ProviderConfig):
     default_summarization_model: str = "gpt-4o-mini"
     default_transcription_model: str = "whisper-1"
 
+    def __post_init__(self) -> None:
+        # Prompts are static, so build them once per config instance
+        self._correction_prompt = _OPENAI_CORRECTION_PROMPT
+        self._summarization_prompt = _SUMMARIZATION_PROMPT
+
     def get_correction_prompt(self) -> str:
         """Get OpenAI-specific correction prompt."""
-        return """這是一段audio transcription，因為是AI產生了，可能有許多錯字與問題，我需要你把它轉成正確的格式，注意這是基督教的文章或者講道或者見證，所以當你不太確定用語的時候，可以朝這個方向思考。
-
-請修正以下內容：
-1. 修正錯字和語法錯誤
-2. 使用繁體中文（台灣）
-3. 適當的標點符號
-4. 保持基督教用語的準確性
-
-只回傳修正後的文字，不要額外說明。"""
+        return self._correction_prompt
 
     def get_summarization_prompt(self) -> str:
         """Get OpenAI-specific summarization prompt."""
-        return """請為這段基督教內容製作摘要，重點包括：
-1. 主要的屬靈教導或信息
-2. 重要的聖經引用或原則
-3. 實際的應用或呼籲
-4. 見證或例子的核心要點
-
-請用繁體中文（台灣）回應，保持基督教用語的準確性。"""
+        return self._summarization_prompt
 
     def get_transcription_params(self, model: str, language: str) -> dict[str, Any]:
         """Get OpenAI-specific transcription parameters."""
@@ -101,19 +144,18 @@ class MistralConfig(ProviderConfig):
     default_summarization_model: str = "mistral-small-latest"
     default_transcription_model: str = "voxtral-mini-latest"
 
+    def __post_init__(self) -> None:
+        # Prompts are static, so build them once per config instance
+        self._correction_prompt = _MISTRAL_CORRECTION_PROMPT
+        self._summarization_prompt = _SUMMARIZATION_PROMPT
+
     def get_correction_prompt(self) -> str:
         """Get Mistral-specific correction prompt."""
-        return """你是一個很熟悉基督教用語的繁體中文文字編輯，這是一段audio transcription，因為是AI產生了，可能有許多錯字與辨識不出來的問題。請你單純修正錯誤的文字，根據上下文給出最合裡的修訂文字，不要額外說明。"""
+        return self._correction_prompt
 
     def get_summarization_prompt(self) -> str:
         """Get Mistral-specific summarization prompt."""
-        return """請為這段基督教內容製作摘要，重點包括：
-1. 主要的屬靈教導或信息
-2. 重要的聖經引用或原則
-3. 實際的應用或呼籲
-4. 見證或例子的核心要點
-
-請用繁體中文（台灣）回應，保持基督教用語的準確性。"""
+        return self._summarization_prompt
 
     def get_transcription_params(self, model: str, language: str) -> dict[str, Any]:
         """Get Mistral-specific transcription parameters."""
@@ -136,8 +178,13 @@ class MistralConfig(ProviderConfig):
         return params
 
 
-# Provider registry for easy extension
-PROVIDER_CONFIGS = {
-    "openai": OpenAIConfig(),
-    "mistral": MistralConfig(),
-}
+OPENAI_CONFIG = OpenAIConfig()
+MISTRAL_CONFIG = MistralConfig()
+
+# Provider registry for easy extension (read-only, shared by all services)
+PROVIDER_CONFIGS: Mapping[str, ProviderConfig] = MappingProxyType(
+    {
+        "openai": OPENAI_CONFIG,
+        "mistral": MISTRAL_CONFIG,
+    }
+)
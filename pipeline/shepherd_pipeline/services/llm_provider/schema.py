@@ -1,8 +1,9 @@
 """Common schemas and types for LLM provider services."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 import logging
-from typing import Protocol
+from typing import Any, ClassVar, Protocol
 
 from loguru import logger
 from pydantic import BaseModel
@@ -16,6 +17,8 @@ class AudioChunk(BaseModel):
     end_time: float
     file_path: str
     duration: float
+    # Audio file the chunk was cut from; identifies the chunk's source
+    source_file: str
 
 
 class TranscriptionResult(BaseModel):
@@ -82,15 +85,24 @@ class LLMServiceProtocol(Protocol):
 class BaseLLMService(ABC):
     """Abstract base class for LLM services."""
 
-    logger: logging.Logger | logging.LoggerAdapter[logging.Logger]
+    # Shared by all services so the Prefect import/probe happens once per process
+    _logger_resolver: ClassVar[Callable[[], Any] | None] = None
 
-    def __init__(self) -> None:
-        try:
-            from prefect import get_run_logger
+    @property
+    def logger(self) -> logging.Logger | logging.LoggerAdapter[logging.Logger]:
+        """Logger for the current run.
 
-            self.logger = get_run_logger()
-        except Exception:
-            self.logger = logger  # type: ignore[assignment]
+        Resolved on each access because service instances are shared across
+        tasks and flow runs.
+        """
+        return self._resolve_logger()  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _resolve_logger() -> Any:  # noqa: ANN401
+        """Return the Prefect run logger inside a run, else the loguru logger."""
+        if BaseLLMService._logger_resolver is None:
+            BaseLLMService._logger_resolver = _build_logger_resolver()
+        return BaseLLMService._logger_resolver()
 
     @abstractmethod
     async def transcribe_audio(
@@ -122,3 +134,20 @@ class BaseLLMService(ABC):
     ) -> SummaryResult:
         """Generate summary of text."""
         pass
+
+
+def _build_logger_resolver() -> Callable[[], Any]:
+    """Build a logger factory that checks the run context instead of raising."""
+    try:
+        from prefect import get_run_logger
+
+        from ...utils.logging import in_prefect_run
+    except ImportError:
+        return lambda: logger
+
+    def resolve() -> Any:  # noqa: ANN401
+        if not in_prefect_run():
+            return logger
+        return get_run_logger()
+
+    return resolve
@@ -1,9 +1,53 @@
 """Model factory for creating AI service instances based on model configuration."""
 
-from enum import Enum
-from typing import Any, Protocol
+from __future__ import annotations
 
-from .llm_provider.schema import CorrectionResult, SummaryResult, TranscriptionResult
+from dataclasses import dataclass
+from enum import Enum
+from functools import cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from typing import Protocol
+
+    from .llm_provider.schema import (
+        CorrectionResult,
+        SummaryResult,
+        TranscriptionResult,
+    )
+
+    # Structural types for the services returned by ModelFactory. They are only
+    # used in annotations, never with isinstance(), so they need not exist at
+    # runtime.
+    class TextProcessorProtocol(Protocol):
+        """Protocol for text processing services."""
+
+        async def correct_text(
+            self, text: str, target_language: str = "zh-TW", model: str = "default"
+        ) -> CorrectionResult:
+            """Correct and enhance transcribed text."""
+            ...
+
+        async def summarize_text(
+            self,
+            text: str,
+            instructions: str | None = None,
+            word_limit: int | None = None,
+            model: str = "default",
+        ) -> SummaryResult:
+            """Generate summary from text."""
+            ...
+
+    class TranscriptionProtocol(Protocol):
+        """Protocol for transcription services."""
+
+        async def transcribe_audio(
+            self, audio_file_path: str, language: str = "zh"
+        ) -> TranscriptionResult:
+            """Transcribe audio to text."""
+            ...
 
 
 class AIProvider(str, Enum):
@@ -22,112 +66,152 @@ class TaskType(str, Enum):
     SUMMARIZATION = "summarization"
 
 
-class TextProcessorProtocol(Protocol):
-    """Protocol for text processing services."""
+@dataclass(slots=True, frozen=True)
+class ModelSpec:
+    """Provider and supported tasks for a model."""
+
+    provider: AIProvider
+    tasks: frozenset[TaskType]
+
+
+# Service instances are stateless apart from credentials, so one per provider is
+# shared across tasks. Imports stay lazy to avoid loading unused providers.
+@cache
+def _mock_service() -> Any:  # noqa: ANN401
+    from .llm_provider.mock import MockAIService
+
+    return MockAIService()
+
+
+@cache
+def _openai_service() -> Any:  # noqa: ANN401
+    from .llm_provider.openai_service import OpenAIService
+
+    return OpenAIService()
+
+
+@cache
+def _mistral_service() -> Any:  # noqa: ANN401
+    from .llm_provider.mistral_service import MistralService
 
-    async def correct_text(
-        self, text: str, target_language: str = "zh-TW", model: str = "default"
-    ) -> CorrectionResult:
-        """Correct and enhance transcribed text."""
-        ...
+    return MistralService()
 
-    async def summarize_text(
-        self,
-        text: str,
-        instructions: str | None = None,
-        word_limit: int | None = None,
-        model: str = "default",
-    ) -> SummaryResult:
-        """Generate summary from text."""
-        ...
 
+# Legacy task strings accepted in place of TaskType
+_LEGACY_TASK: dict[str, TaskType] = {
+    "transcription": TaskType.TRANSCRIPTION,
+    "correction": TaskType.CORRECTION,
+    "summarization": TaskType.SUMMARIZATION,
+}
 
-class TranscriptionProtocol(Protocol):
-    """Protocol for transcription services."""
+_PROVIDER_TO_FACTORY: dict[AIProvider, Callable[[], Any]] = {
+    AIProvider.MOCK: _mock_service,
+    AIProvider.OPENAI: _openai_service,
+    AIProvider.MISTRAL: _mistral_service,
+}
 
-    async def transcribe_audio(
-        self, audio_file_path: str, language: str = "zh"
-    ) -> TranscriptionResult:
-        """Transcribe audio to text."""
-        ...
+# Services handed out by _service_for_model, for close_services()
+_created_services: set[Any] = set()
+
+
+def _index_models(
+    model_config: dict[str, ModelSpec],
+) -> tuple[
+    dict[AIProvider, tuple[str, ...]],
+    dict[tuple[AIProvider, TaskType], tuple[str, ...]],
+]:
+    """Group model names by provider and by (provider, task) in a single pass."""
+    by_provider: dict[AIProvider, list[str]] = {provider: [] for provider in AIProvider}
+    by_provider_task: dict[tuple[AIProvider, TaskType], list[str]] = {}
+    for model, spec in model_config.items():
+        by_provider[spec.provider].append(model)
+        for task_type in spec.tasks:
+            by_provider_task.setdefault((spec.provider, task_type), []).append(model)
+    return (
+        {key: tuple(models) for key, models in by_provider.items()},
+        {key: tuple(models) for key, models in by_provider_task.items()},
+    )
 
 
 class ModelFactory:
     """Factory for creating AI service instances based on model configuration."""
 
     # Model configuration with provider and supported tasks
-    MODEL_CONFIG: dict[str, dict[str, Any]] = {
+    MODEL_CONFIG: dict[str, ModelSpec] = {
         # OpenAI models
-        "gpt-4.1-nano": {
-            "provider": AIProvider.OPENAI,
-            "tasks": [TaskType.CORRECTION, TaskType.SUMMARIZATION],
-        },
-        "gpt-4o-mini": {
-            "provider": AIProvider.OPENAI,
-            "tasks": [TaskType.CORRECTION, TaskType.SUMMARIZATION],
-        },
-        "gpt-4.1-mini": {
-            "provider": AIProvider.OPENAI,
-            "tasks": [TaskType.CORRECTION, TaskType.SUMMARIZATION],
-        },
-        "gpt-4o-mini-transcribe": {
-            "provider": AIProvider.OPENAI,
-            "tasks": [TaskType.TRANSCRIPTION],
-        },
-        "gpt-4o-transcribe": {
-            "provider": AIProvider.OPENAI,
-            "tasks": [TaskType.TRANSCRIPTION],
-        },
+        "gpt-4.1-nano": ModelSpec(
+            provider=AIProvider.OPENAI,
+            tasks=frozenset({TaskType.CORRECTION, TaskType.SUMMARIZATION}),
+        ),
+        "gpt-4o-mini": ModelSpec(
+            provider=AIProvider.OPENAI,
+            tasks=frozenset({TaskType.CORRECTION, TaskType.SUMMARIZATION}),
+        ),
+        "gpt-4.1-mini": ModelSpec(
+            provider=AIProvider.OPENAI,
+            tasks=frozenset({TaskType.CORRECTION, TaskType.SUMMARIZATION}),
+        ),
+        "gpt-4o-mini-transcribe": ModelSpec(
+            provider=AIProvider.OPENAI,
+            tasks=frozenset({TaskType.TRANSCRIPTION}),
+        ),
+        "gpt-4o-transcribe": ModelSpec(
+            provider=AIProvider.OPENAI,
+            tasks=frozenset({TaskType.TRANSCRIPTION}),
+        ),
         # Mistral models
-        "mistral-small-latest": {
-            "provider": AIProvider.MISTRAL,
-            "tasks": [TaskType.CORRECTION, TaskType.SUMMARIZATION],
-        },
-        "mistral-medium-2505": {
-            "provider": AIProvider.MISTRAL,
-            "tasks": [TaskType.CORRECTION, TaskType.SUMMARIZATION],
-        },
-        "voxtral-mini-latest": {
-            "provider": AIProvider.MISTRAL,
-            "tasks": [TaskType.TRANSCRIPTION],
-        },
-        "voxtral-small-latest": {
-            "provider": AIProvider.MISTRAL,
-            "tasks": [TaskType.TRANSCRIPTION],
-        },
+        "mistral-small-latest": ModelSpec(
+            provider=AIProvider.MISTRAL,
+            tasks=frozenset({TaskType.CORRECTION, TaskType.SUMMARIZATION}),
+        ),
+        "mistral-medium-2505": ModelSpec(
+            provider=AIProvider.MISTRAL,
+            tasks=frozenset({TaskType.CORRECTION, TaskType.SUMMARIZATION}),
+        ),
+        "voxtral-mini-latest": ModelSpec(
+            provider=AIProvider.MISTRAL,
+            tasks=frozenset({TaskType.TRANSCRIPTION}),
+        ),
+        "voxtral-small-latest": ModelSpec(
+            provider=AIProvider.MISTRAL,
+            tasks=frozenset({TaskType.TRANSCRIPTION}),
+        ),
         # Mock model
-        "mock-model": {
-            "provider": AIProvider.MOCK,
-            "tasks": [
-                TaskType.TRANSCRIPTION,
-                TaskType.CORRECTION,
-                TaskType.SUMMARIZATION,
-            ],
-        },
+        "mock-model": ModelSpec(
+            provider=AIProvider.MOCK,
+            tasks=frozenset(TaskType),
+        ),
     }
 
+    # Provider assumed for models missing from MODEL_CONFIG
+    DEFAULT_PROVIDER = AIProvider.MISTRAL
+
     # Legacy provider mapping for backward compatibility
     MODEL_PROVIDERS: dict[str, AIProvider] = {
-        model: config["provider"] for model, config in MODEL_CONFIG.items()
+        model: spec.provider for model, spec in MODEL_CONFIG.items()
     }
 
-    # Default models for each provider and task
-    DEFAULT_MODELS: dict[tuple[AIProvider, TaskType], str] = {
-        (AIProvider.OPENAI, TaskType.TRANSCRIPTION): "gpt-4o-mini-transcribe",
-        (AIProvider.OPENAI, TaskType.CORRECTION): "gpt-4o-mini",
-        (AIProvider.OPENAI, TaskType.SUMMARIZATION): "gpt-4o-mini",
-        (AIProvider.MISTRAL, TaskType.TRANSCRIPTION): "voxtral-mini-latest",
-        (AIProvider.MISTRAL, TaskType.CORRECTION): "mistral-small-latest",
-        (AIProvider.MISTRAL, TaskType.SUMMARIZATION): "mistral-small-latest",
-        (AIProvider.MOCK, TaskType.TRANSCRIPTION): "mock-model",
-        (AIProvider.MOCK, TaskType.CORRECTION): "mock-model",
-        (AIProvider.MOCK, TaskType.SUMMARIZATION): "mock-model",
+    # Default models for each provider and task, keyed by the enum values
+    DEFAULT_MODELS: dict[tuple[str, str], str] = {
+        ("openai", "transcription"): "gpt-4o-mini-transcribe",
+        ("openai", "correction"): "gpt-4o-mini",
+        ("openai", "summarization"): "gpt-4o-mini",
+        ("mistral", "transcription"): "voxtral-mini-latest",
+        ("mistral", "correction"): "mistral-small-latest",
+        ("mistral", "summarization"): "mistral-small-latest",
+        ("mock", "transcription"): "mock-model",
+        ("mock", "correction"): "mock-model",
+        ("mock", "summarization"): "mock-model",
     }
 
+    # Lookup tables derived from MODEL_CONFIG
+    _MODELS_BY_PROVIDER, _MODELS_BY_PROVIDER_TASK = _index_models(MODEL_CONFIG)
+    _SUPPORTED_MODELS = MappingProxyType(_MODELS_BY_PROVIDER)
+
     @classmethod
     def get_provider_for_model(cls, model: str) -> AIProvider:
         """Determine the provider for a given model."""
-        return cls.MODEL_PROVIDERS.get(model, AIProvider.MISTRAL)
+        return cls.MODEL_PROVIDERS.get(model, cls.DEFAULT_PROVIDER)
 
     @classmethod
     def validate_model(
@@ -137,83 +221,56 @@ class ModelFactory:
         if model not in cls.MODEL_CONFIG:
             return False
 
-        config = cls.MODEL_CONFIG[model]
+        spec = cls.MODEL_CONFIG[model]
 
         # Check if provider matches (if provided)
-        if provider is not None and config["provider"] != provider:
+        if provider is not None and spec.provider != provider:
             return False
 
         # Check if task is supported
-        return task_type in config["tasks"]
-
-    @classmethod
-    def get_models(cls, provider: AIProvider, task_type: TaskType) -> list[str]:
-        """Get all models for a specific provider and task type."""
-        return [
-            model
-            for model, config in cls.MODEL_CONFIG.items()
-            if config["provider"] == provider and task_type in config["tasks"]
-        ]
+        return task_type in spec.tasks
 
     @classmethod
-    def _create_service_instance(cls, provider: AIProvider) -> Any:  # noqa: ANN401
-        """Create a service instance for the given provider."""
-        if provider == AIProvider.MOCK:
-            from .llm_provider.mock import MockAIService
+    def get_models(cls, provider: AIProvider, task_type: TaskType) -> tuple[str, ...]:
+        """Get all models for a specific provider and task type, in config order.
 
-            return MockAIService()
-        elif provider == AIProvider.OPENAI:
-            from .llm_provider.openai_service import OpenAIService
-
-            return OpenAIService()
-        elif provider == AIProvider.MISTRAL:
-            from .llm_provider.mistral_service import MistralService
-
-            return MistralService()
-        else:
-            raise ValueError(f"Unknown provider: {provider}")
+        Returns a tuple shared by all callers rather than a new list; copy it
+        with list() to build on it.
+        """
+        return cls._MODELS_BY_PROVIDER_TASK.get((provider, task_type), ())
 
     @classmethod
     def create_text_processor(cls, model: str) -> TextProcessorProtocol:
         """Create a text processing service instance based on model."""
-        provider = cls.get_provider_for_model(model)
-        return cls._create_service_instance(provider)
+        return _service_for_model(model)
 
     @classmethod
     def create_summarization_service(cls, model: str) -> TextProcessorProtocol:
         """Create a summarization service instance based on model."""
-        provider = cls.get_provider_for_model(model)
-        return cls._create_service_instance(provider)
+        return _service_for_model(model)
 
     @classmethod
-    def get_supported_models(cls) -> dict[AIProvider, list[str]]:
-        """Get all supported models grouped by provider."""
-        models_by_provider: dict[AIProvider, list[str]] = {
-            AIProvider.OPENAI: [],
-            AIProvider.MISTRAL: [],
-            AIProvider.MOCK: [],
-        }
-
-        for model, config in cls.MODEL_CONFIG.items():
-            provider = config["provider"]
-            models_by_provider[provider].append(model)
+    def get_supported_models(cls) -> Mapping[AIProvider, tuple[str, ...]]:
+        """Get all supported models grouped by provider.
 
-        return models_by_provider
+        Returns a read-only mapping of provider to model tuples, built once from
+        MODEL_CONFIG and shared by all callers, rather than a new dict of lists;
+        copy it to modify it.
+        """
+        return cls._SUPPORTED_MODELS
 
     @classmethod
     def get_default_model_for_provider(
         cls, provider: AIProvider, task: TaskType | str
     ) -> str:
         """Get default model for a provider and task type."""
-        if isinstance(task, TaskType):
-            task_type = task
-        else:
-            # Legacy string support
-            if task == "transcription":
-                task_type = TaskType.TRANSCRIPTION
-            else:
-                task_type = TaskType.CORRECTION  # Default to correction for text tasks
-        return cls.DEFAULT_MODELS.get((provider, task_type), "mock-model")
+        # Unknown legacy strings are treated as text tasks
+        task_type = (
+            task
+            if isinstance(task, TaskType)
+            else _LEGACY_TASK.get(task, TaskType.CORRECTION)
+        )
+        return cls.DEFAULT_MODELS.get((provider.value, task_type.value), "mock-model")
 
     @classmethod
     def validate_model_simple(cls, model: str) -> bool:
@@ -223,5 +280,33 @@ class ModelFactory:
     @classmethod
     def create_transcription_service(cls, model: str) -> TranscriptionProtocol:
         """Create a transcription service instance based on model."""
-        provider = cls.get_provider_for_model(model)
-        return cls._create_service_instance(provider)
+        return _service_for_model(model)
+
+    @classmethod
+    async def close_services(cls) -> None:
+        """Close the pooled HTTP clients of every service created so far.
+
+        Call this when a flow finishes so connection pools don't outlive it; the
+        services stay usable and open new clients when needed.
+        """
+        for service in list(_created_services):
+            aclose = getattr(service, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+
+# Direct model -> service factory dispatch, built once from MODEL_CONFIG
+_MODEL_TO_FACTORY: dict[str, Callable[[], Any]] = {
+    model: _PROVIDER_TO_FACTORY[spec.provider]
+    for model, spec in ModelFactory.MODEL_CONFIG.items()
+}
+
+
+def _service_for_model(model: str) -> Any:  # noqa: ANN401
+    """Get the shared service for a model, using the default provider if unknown."""
+    factory = _MODEL_TO_FACTORY.get(model)
+    if factory is None:
+        factory = _PROVIDER_TO_FACTORY[ModelFactory.DEFAULT_PROVIDER]
+    service = factory()
+    _created_services.add(service)
+    return service
@@ -1,71 +1,148 @@
 """Chinese translation service using OpenCC."""
 
+from functools import cache
+from pathlib import Path
 from typing import Any
 
 try:
     from prefect import get_run_logger
 
+    from ..utils.logging import in_prefect_run
+
     PREFECT_AVAILABLE = True
 except ImportError:
     PREFECT_AVAILABLE = False
 
 try:
-    from opencc import OpenCC  # type: ignore[import-untyped]
+    import opencc  # type: ignore[import-untyped]
+    from opencc import OpenCC
 
     OPENCC_AVAILABLE = True
 except ImportError:
     OPENCC_AVAILABLE = False
 
 
+# Dictionaries in the s2tw conversion chain (see opencc/config/s2tw.json)
+_S2TW_DICTIONARIES = ("STPhrases.txt", "STCharacters.txt", "TWVariants.txt")
+
+# Marker characters for the simplified/traditional detection heuristic
+_SIMPLIFIED_CHARS = frozenset("国会时间长东发业产设认为说话语过个学来人么区域建发达觉")
+_TRADITIONAL_CHARS = frozenset("國會時間長東發業產設認為說話語過個學來人麼區域建發達覺")
+
+
+@cache
+def _s2tw_convertible_chars() -> frozenset[str] | None:
+    """Characters s2tw may rewrite, or None if the dictionaries can't be read.
+
+    Text containing none of them converts to itself, so the conversion can be
+    skipped. Phrase entries only contribute the characters they actually
+    change (e.g. 了 in 了解 -> 瞭解).
+    """
+    dictionary_dir = Path(opencc.__file__).parent / "dictionary"
+    chars: set[str] = set()
+    try:
+        for name in _S2TW_DICTIONARIES:
+            text = (dictionary_dir / name).read_text(encoding="utf-8")
+            for line in text.splitlines():
+                source, _, targets = line.partition("\t")
+                # The converter always takes the first candidate
+                target = targets.split(" ", 1)[0]
+                if len(source) == len(target):
+                    chars.update(
+                        s for s, t in zip(source, target, strict=True) if s != t
+                    )
+                else:
+                    chars.update(source)
+    except OSError:
+        return None
+    return frozenset(chars)
+
+
+@cache
+def _get_converter(config: str) -> Any:  # noqa: ANN401
+    """Get the shared OpenCC converter for a config, built on first use.
+
+    Converters load their dictionaries from disk, so there is one per process,
+    and importing this module stays cheap for code paths that never convert.
+    """
+    return OpenCC(config)
+
+
+class _NullLogger:
+    """Logger stand-in that drops messages when not running under Prefect."""
+
+    def info(self, *_args: Any, **_kwargs: Any) -> None:  # noqa: ANN401
+        pass
+
+    def warning(self, *_args: Any, **_kwargs: Any) -> None:  # noqa: ANN401
+        pass
+
+    def error(self, *_args: Any, **_kwargs: Any) -> None:  # noqa: ANN401
+        pass
+
+
+_NULL_LOGGER = _NullLogger()
+
+
+def _get_logger() -> Any:  # noqa: ANN401
+    """Get the Prefect run logger inside a run, else the no-op logger."""
+    if PREFECT_AVAILABLE and in_prefect_run():
+        return get_run_logger()
+    return _NULL_LOGGER
+
+
 class ChineseTranslationService:
     """Service for Chinese text conversion using OpenCC."""
 
     def __init__(self) -> None:
-        # Try to get Prefect logger, fallback to None if not in Prefect context
-        self.logger: Any = None
-        try:
-            if PREFECT_AVAILABLE:
-                self.logger = get_run_logger()
-        except Exception:
-            pass
-
-        if OPENCC_AVAILABLE:
-            # Initialize OpenCC converters
-            self.s2tw = OpenCC("s2tw")  # Simplified to Traditional (Taiwan)
-            self.t2tw = OpenCC(
-                "t2tw"
-            )  # Traditional to Traditional (Taiwan) - standardization
-        else:
-            if self.logger:
-                self.logger.warning("OpenCC not available, translation will be skipped")
+        if not OPENCC_AVAILABLE:
+            self.logger.warning("OpenCC not available, translation will be skipped")
+
+    @property
+    def s2tw(self) -> Any:  # noqa: ANN401
+        """Simplified to Traditional (Taiwan) converter."""
+        return _get_converter("s2tw")
+
+    @property
+    def t2tw(self) -> Any:  # noqa: ANN401
+        """Traditional to Traditional (Taiwan) converter, for standardization."""
+        return _get_converter("t2tw")
+
+    @property
+    def logger(self) -> Any:  # noqa: ANN401
+        """Prefect logger inside a run, otherwise a no-op logger.
+
+        Resolved on each access so one instance can be shared across task runs.
+        """
+        return _get_logger()
 
     def to_traditional_chinese(self, text: str) -> str:
         """Convert text to Traditional Chinese (Taiwan standard)."""
 
         if not OPENCC_AVAILABLE:
-            if self.logger:
-                self.logger.warning("OpenCC not available, returning original text")
+            self.logger.warning("OpenCC not available, returning original text")
             return text
 
         if not text or not text.strip():
             return text
 
-        try:
-            # First convert simplified to traditional
-            traditional = self.s2tw.convert(text)
+        # Skip OpenCC's phrase matching when it would leave the text unchanged
+        convertible_chars = _s2tw_convertible_chars()
+        if convertible_chars is not None and convertible_chars.isdisjoint(text):
+            return text
 
-            # Then standardize to Taiwan variant
-            taiwan_traditional = self.t2tw.convert(traditional)
+        try:
+            # s2tw already ends with the Taiwan variant table that t2tw applies,
+            # so a single pass gives the standardized result
+            taiwan_traditional = self.s2tw.convert(text)
 
-            if self.logger:
-                self.logger.info(
-                    f"Text converted to Traditional Chinese (TW): {len(text)} chars"
-                )
+            self.logger.info(
+                f"Text converted to Traditional Chinese (TW): {len(text)} chars"
+            )
             return str(taiwan_traditional)
 
         except Exception as e:
-            if self.logger:
-                self.logger.error(f"Chinese translation failed: {e}")
+            self.logger.error(f"Chinese translation failed: {e}")
             return text  # Return original text if conversion fails
 
     def detect_and_convert(self, text: str) -> str:
@@ -74,26 +151,30 @@ class ChineseTranslationService:
         if not OPENCC_AVAILABLE:
             return text
 
-        # Simple heuristic to detect if text contains simplified characters
-        simplified_chars = set("国会时间长东发业产设认为说话语过个学来人么区域建发达觉")
-        traditional_chars = set(
-            "國會時間長東發業產設認為說話語過個學來人麼區域建發達覺"
-        )
+        # Nothing for OpenCC to convert in pure ASCII (e.g. English) text
+        if text.isascii():
+            return text
 
-        has_simplified = any(char in simplified_chars for char in text)
-        has_traditional = any(char in traditional_chars for char in text)
+        # Simple heuristic to detect if text contains simplified characters
+        has_simplified = not _SIMPLIFIED_CHARS.isdisjoint(text)
+        has_traditional = not _TRADITIONAL_CHARS.isdisjoint(text)
 
         if has_simplified and not has_traditional:
-            if self.logger:
-                self.logger.info(
-                    "Detected Simplified Chinese, converting to Traditional"
-                )
+            self.logger.info("Detected Simplified Chinese, converting to Traditional")
             return self.to_traditional_chinese(text)
         else:
             # Already traditional or mixed, just standardize to Taiwan format
-            if self.logger:
-                self.logger.info("Standardizing to Taiwan Traditional Chinese")
+            self.logger.info("Standardizing to Taiwan Traditional Chinese")
             try:
                 return str(self.t2tw.convert(text)) if OPENCC_AVAILABLE else text
             except Exception:
                 return text
+
+
+@cache
+def get_translation_service() -> ChineseTranslationService:
+    """Get the translation service shared by all callers in this process.
+
+    The service holds no per-call state, so one instance can serve every task.
+    """
+    return ChineseTranslationService()
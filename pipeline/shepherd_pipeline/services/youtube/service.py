@@ -48,9 +48,7 @@ class YouTubeService:
         # Configure yt-dlp options
         ydl_opts = {
             "format": "bestaudio/best",
-            "outtmpl": str(
-                output_path_obj.with_suffix("")
-            ),  # yt-dlp will add extension
+            "outtmpl": str(output_path_obj.with_suffix(".%(ext)s")),
             "noplaylist": True,
             "quiet": True,
             "no_warnings": True,
@@ -82,8 +80,8 @@ class YouTubeService:
             # Run yt-dlp in a separate thread to avoid blocking
             info = await asyncio.to_thread(self._download_with_ytdl, url, ydl_opts)
 
-            # Find the actual output file (yt-dlp may add its own extension)
-            actual_output_path = self._find_output_file(output_path_obj)
+            # yt-dlp reports the final path after post-processing
+            actual_output_path = self._get_output_path(info)
 
             if not actual_output_path or not actual_output_path.exists():
                 raise FileNotFoundError(
@@ -129,27 +127,16 @@ class YouTubeService:
     def _download_with_ytdl(self, url: str, ydl_opts: dict[str, Any]) -> dict[str, Any]:
         """Download video using yt-dlp (blocking operation)."""
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            # Extract info first
-            info: dict[str, Any] = ydl.extract_info(url, download=False)
-
-            # Then download
-            ydl.download([url])
-
+            # Resolve metadata and download in a single pass
+            info: dict[str, Any] = ydl.extract_info(url, download=True)
             return info
 
-    def _find_output_file(self, expected_path: Path) -> Path | None:
-        """Find the actual output file created by yt-dlp."""
-        # yt-dlp might create files with different extensions
-        possible_extensions = [".mp3", ".m4a", ".webm", ".ogg"]
-        base_path = expected_path.with_suffix("")
-
-        for ext in possible_extensions:
-            candidate = base_path.with_suffix(ext)
-            if candidate.exists():
-                return candidate
-
-        # Also check if the exact path exists
-        if expected_path.exists():
-            return expected_path
+    @staticmethod
+    def _get_output_path(info: dict[str, Any]) -> Path | None:
+        """Get the final file path yt-dlp wrote for a downloaded video."""
+        downloads = info.get("requested_downloads")
+        if downloads:
+            return Path(downloads[-1]["filepath"])
 
-        return None
+        filename = info.get("filepath") or info.get("_filename")
+        return Path(filename) if filename else None
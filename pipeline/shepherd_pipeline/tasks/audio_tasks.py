@@ -1,7 +1,11 @@
 """Audio processing tasks for the pipeline."""
 
+import asyncio
+import csv
 from pathlib import Path
+import shutil
 from uuid import uuid4
+import weakref
 
 from prefect import get_run_logger, task
 from pydantic import HttpUrl
@@ -23,6 +27,11 @@ try:
 except ImportError:
     PYDUB_AVAILABLE = False
 
+# Downloads in progress, per event loop (Prefect may run tasks on several loops)
+_inflight_downloads: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Future[AudioResult]]
+] = weakref.WeakKeyDictionary()
+
 
 @task(
     retries=3,
@@ -48,6 +57,35 @@ async def download_youtube_audio(
         logger.info("Found existing download")
         return audio_result
 
+    # Coalesce concurrent requests for the same audio into one download
+    inflight = _inflight_downloads.setdefault(asyncio.get_running_loop(), {})
+    download = inflight.get(audio_key)
+    if download is None:
+        download = asyncio.ensure_future(
+            _download_audio(
+                artifact_manager, audio_key, youtube_url, start_time, end_time, use_mock
+            )
+        )
+        inflight[audio_key] = download
+        download.add_done_callback(lambda _: inflight.pop(audio_key, None))
+    else:
+        logger.info("Waiting for in-progress download of the same audio")
+
+    # Shield so one cancelled caller doesn't cancel the download for the others
+    result = await asyncio.shield(download)
+    logger.info(f"Downloaded and saved audio to artifacts: {result.file_path}")
+    return result
+
+
+async def _download_audio(
+    artifact_manager: ArtifactManager,
+    audio_key: str,
+    youtube_url: HttpUrl,
+    start_time: float | None,
+    end_time: float | None,
+    use_mock: bool,
+) -> AudioResult:
+    """Download audio into the artifact folder for audio_key and record it."""
     audio_folder = artifact_manager.audio_folder(audio_key)
     audio_folder.mkdir(parents=True, exist_ok=True)
 
@@ -58,13 +96,11 @@ async def download_youtube_audio(
     if use_mock:
         # Use mock service
         youtube_service = MockYouTubeService(root_dir=str(audio_folder))
-        artifact_manager.audio_folder(audio_key).mkdir(parents=True, exist_ok=True)
 
     result = await youtube_service.download_audio(
         str(youtube_url), start_time, end_time
     )
     artifact_manager.save_audio(audio_key, result)
-    logger.info(f"Downloaded and saved audio to artifacts: {result.file_path}")
     return result
 
 
@@ -102,6 +138,7 @@ async def chunk_audio(
                     end_time=end_time,
                     file_path=chunk_path,
                     duration=end_time - current_time,
+                    source_file=audio_result.file_path,
                 )
             )
 
@@ -112,13 +149,26 @@ async def chunk_audio(
         return chunks
 
     else:
-        # Production audio chunking using pydub
-        if not PYDUB_AVAILABLE:
-            raise ImportError("pydub is required for production audio chunking")
-
         if not Path(audio_result.file_path).exists():
             raise FileNotFoundError(f"Audio file not found: {audio_result.file_path}")
 
+        # Prefer splitting with ffmpeg directly: no full decode, no re-encode
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg:
+            try:
+                chunks = await _segment_audio_with_ffmpeg(
+                    ffmpeg, Path(audio_result.file_path), chunks_dir, chunk_size_minutes
+                )
+            except RuntimeError as e:
+                logger.warning(f"Falling back to pydub for chunking: {e}")
+            else:
+                logger.info(f"Created {len(chunks)} chunks")
+                return chunks
+
+        # Fall back to pydub, which decodes the whole file into memory
+        if not PYDUB_AVAILABLE:
+            raise ImportError("pydub is required for production audio chunking")
+
         # Load audio file
         audio = AudioSegment.from_file(str(audio_result.file_path))
 
@@ -128,20 +178,20 @@ async def chunk_audio(
         # Create chunks using pydub
         pydub_chunks = make_chunks(audio, chunk_duration_ms)
 
+        # make_chunks cuts fixed-length chunks, only the last one can be shorter
+        chunk_duration_seconds = chunk_size_minutes * 60.0
+        total_seconds = len(audio) / 1000.0  # pydub uses milliseconds
+
         chunks = []
-        current_time = 0.0
+        exports: list[tuple[AudioSegment, str]] = []
         for i, chunk in enumerate(pydub_chunks):
-            # Calculate timing based on actual accumulated duration
-            start_time = current_time
-            duration_seconds = len(chunk) / 1000.0  # pydub uses milliseconds
-            end_time = start_time + duration_seconds
-            current_time = end_time
+            start_time = i * chunk_duration_seconds
+            end_time = min(start_time + chunk_duration_seconds, total_seconds)
+            duration_seconds = end_time - start_time
 
             # Create chunk file path in artifacts directory
             chunk_path = str(chunks_dir / f"chunk_{uuid4()}_{i}.mp3")
-
-            # Export chunk to file
-            chunk.export(chunk_path, format="mp3")
+            exports.append((chunk, chunk_path))
 
             chunks.append(
                 AudioChunk(
@@ -150,8 +200,78 @@ async def chunk_audio(
                     end_time=end_time,
                     file_path=chunk_path,
                     duration=duration_seconds,
+                    source_file=audio_result.file_path,
                 )
             )
 
+        # Each export runs its own ffmpeg encode, so run them concurrently in
+        # worker threads instead of one after another on the event loop
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(chunk.export, chunk_path, format="mp3")
+                for chunk, chunk_path in exports
+            )
+        )
+
         logger.info(f"Created {len(chunks)} chunks")
         return chunks
+
+
+async def _segment_audio_with_ffmpeg(
+    ffmpeg: str, source: Path, chunks_dir: Path, chunk_size_minutes: int
+) -> list[AudioChunk]:
+    """Split audio into chunks with ffmpeg's segment muxer using stream copy."""
+    prefix = f"chunk_{uuid4()}"
+    segment_list = chunks_dir / f"{prefix}.csv"
+
+    process = await asyncio.create_subprocess_exec(
+        ffmpeg,
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        str(source),
+        "-map",
+        "0:a",
+        "-c",
+        "copy",
+        "-f",
+        "segment",
+        "-segment_time",
+        str(chunk_size_minutes * 60),
+        "-segment_list",
+        str(segment_list),
+        "-segment_list_type",
+        "csv",
+        str(chunks_dir / f"{prefix}_%d{source.suffix}"),
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await process.communicate()
+    if process.returncode != 0:
+        # Drop any segments written before the failure
+        for path in chunks_dir.glob(f"{prefix}*"):
+            path.unlink(missing_ok=True)
+        raise RuntimeError(
+            f"ffmpeg failed to segment {source}: {stderr.decode(errors='replace')}"
+        )
+
+    # Each row is "<filename>,<start seconds>,<end seconds>"
+    chunks = []
+    with segment_list.open(newline="") as f:
+        for i, (filename, start, end) in enumerate(csv.reader(f)):
+            start_time, end_time = float(start), float(end)
+            chunks.append(
+                AudioChunk(
+                    chunk_id=f"chunk_{i}",
+                    start_time=start_time,
+                    end_time=end_time,
+                    file_path=str(chunks_dir / filename),
+                    duration=end_time - start_time,
+                    source_file=str(source),
+                )
+            )
+    segment_list.unlink()
+
+    return chunks
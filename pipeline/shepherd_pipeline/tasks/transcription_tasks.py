@@ -1,5 +1,7 @@
 """Transcription-related Prefect tasks."""
 
+import asyncio
+
 from prefect import get_run_logger, task
 
 from ..services.llm_provider.schema import (
@@ -7,14 +9,29 @@ from ..services.llm_provider.schema import (
     CorrectionResult,
     TranscriptionResult,
 )
-from ..services.model_factory import ModelFactory
-from ..services.translation_service import ChineseTranslationService
+from ..services.model_factory import AIProvider, ModelFactory
+from ..services.translation_service import get_translation_service
+from ..utils.artifact_manager import ArtifactManager
+
+# Cached transcriptions and corrections are reused across retries and re-runs
+# for up to a week
+TRANSCRIPTION_CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+CORRECTION_CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+# Chunks ending in one of these are joined without a separating space
+_SENTENCE_ENDS = frozenset({"。", "！", "？", "\n"})
+
+
+def _is_cacheable(model: str) -> bool:
+    """Check if a model's results may be cached; mock results are made up."""
+    return ModelFactory.get_provider_for_model(model) != AIProvider.MOCK
 
 
 @task(
-    retries=3,
-    retry_delay_seconds=[4, 8, 16],  # exponential backoff
-    retry_jitter_factor=0.1,
+    retries=4,
+    # Short first delay: rate limits are already backed off in the HTTP client
+    retry_delay_seconds=[0.5, 2, 8, 16],
+    retry_jitter_factor=0.2,
 )
 async def transcribe_audio_chunk(
     audio_chunk: AudioChunk,
@@ -24,6 +41,26 @@ async def transcribe_audio_chunk(
     """Transcribe a single audio chunk and translate to Traditional Chinese."""
     logger = get_run_logger()
 
+    # Chunk file names are random, so key on the source audio (downloads are
+    # stored per URL and time range) and the chunk's time range; a re-run
+    # after a crash only transcribes the chunks that did not finish
+    artifact_manager = ArtifactManager()
+    cache_key = None
+    if _is_cacheable(model):
+        cache_key = artifact_manager.get_artifact_key(
+            source_file=audio_chunk.source_file,
+            start_time=audio_chunk.start_time,
+            end_time=audio_chunk.end_time,
+            model=model,
+            language=language,
+        )
+        cached = artifact_manager.get_transcription(
+            cache_key, max_age_seconds=TRANSCRIPTION_CACHE_MAX_AGE_SECONDS
+        )
+        if cached:
+            logger.info(f"Found cached transcription for {audio_chunk.chunk_id}")
+            return cached
+
     # Use the model factory to create appropriate transcription service
     transcription_service = ModelFactory.create_transcription_service(model)
     service_language = "zh" if language.startswith("zh") else language
@@ -50,16 +87,25 @@ async def transcribe_audio_chunk(
             f"Transcription failed for chunk {audio_chunk.file_path}: {result.failure_reason}"
         )
 
-    # Translate to Traditional Chinese (Taiwan) using OpenCC
-    translation_service = ChineseTranslationService()
-    translated_text = translation_service.to_traditional_chinese(result.raw_text)
+    # Translate Chinese transcripts to Traditional Chinese (Taiwan) using OpenCC
+    if language.startswith("zh"):
+        translation_service = get_translation_service()
+        translated_text = translation_service.to_traditional_chinese(result.raw_text)
+    else:
+        translated_text = result.raw_text
 
     # Update the result with translated text
     result.raw_text = translated_text
     result.language = language  # Keep the original language setting
+    if cache_key is not None:
+        artifact_manager.save_transcription(cache_key, result)
 
+    # Lazy %-formatting: previews are only built if the record is emitted
     logger.info(
-        f"Text converted to Traditional Chinese (TW): {len(translated_text)} chars, transcription preview {audio_chunk.chunk_id}: {translated_text[:100]}..."
+        "Text converted to Traditional Chinese (TW): %d chars, transcription preview %s: %.100s...",
+        len(translated_text),
+        audio_chunk.chunk_id,
+        translated_text,
     )
 
     return result
@@ -75,20 +121,28 @@ async def transcribe_chunks_parallel(
     logger = get_run_logger()
     logger.info(f"Starting parallel transcription of {len(chunks)} chunks")
 
-    tasks = [
-        transcribe_audio_chunk.submit(audio_chunk=chunk, model=model, language=language)
-        for chunk in chunks
-    ]
-    results: list[TranscriptionResult] = [task.result() for task in tasks]  # type: ignore
+    # Awaiting the async task calls together runs them concurrently on this
+    # event loop instead of blocking it on each future's result()
+    results = list(
+        await asyncio.gather(
+            *(
+                transcribe_audio_chunk(
+                    audio_chunk=chunk, model=model, language=language
+                )
+                for chunk in chunks
+            )
+        )
+    )
 
     logger.info(f"Completed transcription of {len(results)} chunks")
     return results
 
 
 @task(
-    retries=3,
-    retry_delay_seconds=[4, 8, 16],  # exponential backoff
-    retry_jitter_factor=0.1,
+    retries=4,
+    # Short first delay: rate limits are already backed off in the HTTP client
+    retry_delay_seconds=[0.5, 2, 8, 16],
+    retry_jitter_factor=0.2,
 )
 async def correct_transcription(
     transcription: TranscriptionResult,
@@ -98,6 +152,21 @@ async def correct_transcription(
     """Correct and enhance transcribed text with Christian context."""
     logger = get_run_logger()
 
+    # Correction runs at temperature 0, so the same text, model and language
+    # give the same correction; skip the API call
+    artifact_manager = ArtifactManager()
+    cache_key = None
+    if _is_cacheable(model):
+        cache_key = artifact_manager.get_artifact_key(
+            text=transcription.raw_text, model=model, language=target_language
+        )
+        cached = artifact_manager.get_correction(
+            cache_key, max_age_seconds=CORRECTION_CACHE_MAX_AGE_SECONDS
+        )
+        if cached:
+            logger.info("Found cached correction")
+            return cached
+
     # Use model factory to create appropriate service
     text_processor = ModelFactory.create_text_processor(model=model)
 
@@ -108,34 +177,56 @@ async def correct_transcription(
         raise RuntimeError(
             f"Correction failed for {transcription.raw_text}: {result.failure_reason}"
         )
+    if cache_key is not None:
+        artifact_manager.save_correction(cache_key, result)
 
     # Log correction preview
     logger.info(
-        f"Correction preview for {transcription.raw_text[:100]}...: {result.corrected_text[:100]}..."
+        "Correction preview for %.100s...: %.100s...",
+        transcription.raw_text,
+        result.corrected_text,
     )
     return result
 
 
 @task
-async def correct_transcriptions_parallel(
-    transcriptions: list[TranscriptionResult],
-    target_language: str = "zh-TW",
-    model: str = "mistral-small-latest",
-) -> list[CorrectionResult]:
-    """Correct multiple transcriptions in parallel."""
+async def transcribe_and_correct_parallel(
+    chunks: list[AudioChunk],
+    transcription_model: str = "voxtral-mini-latest",
+    correction_model: str = "mistral-small-latest",
+    language: str = "zh-TW",
+) -> tuple[list[TranscriptionResult], list[CorrectionResult]]:
+    """Transcribe and correct chunks, correcting each as soon as it is transcribed.
+
+    Overlaps the two stages instead of waiting for every transcription before
+    starting any correction. Results keep the chunk order.
+    """
     logger = get_run_logger()
-    logger.info(f"Starting parallel correction of {len(transcriptions)} transcriptions")
+    logger.info(
+        f"Starting parallel transcription and correction of {len(chunks)} chunks"
+    )
 
-    tasks = [
-        correct_transcription.submit(
-            transcription=transcription, target_language=target_language, model=model
+    async def transcribe_then_correct(
+        chunk: AudioChunk,
+    ) -> tuple[TranscriptionResult, CorrectionResult]:
+        transcription = await transcribe_audio_chunk(
+            audio_chunk=chunk, model=transcription_model, language=language
+        )
+        correction = await correct_transcription(
+            transcription=transcription,
+            target_language=language,
+            model=correction_model,
         )
-        for transcription in transcriptions
-    ]
-    results: list[CorrectionResult] = [task.result() for task in tasks]  # type: ignore
+        return transcription, correction
 
-    logger.info(f"Completed correction of {len(results)} transcriptions")
-    return results
+    results = await asyncio.gather(
+        *(transcribe_then_correct(chunk) for chunk in chunks)
+    )
+    transcriptions = [transcription for transcription, _ in results]
+    corrections = [correction for _, correction in results]
+
+    logger.info(f"Completed transcription and correction of {len(results)} chunks")
+    return transcriptions, corrections
 
 
 @task
@@ -143,10 +234,10 @@ async def merge_corrected_texts(corrections: list[CorrectionResult]) -> str:
     """Merge corrected text chunks into a single document."""
 
     # Sort by chunk_id to maintain order
-    merged_text = ""
+    parts: list[str] = []
     for correction in corrections:
-        merged_text += correction.corrected_text
-        if not correction.corrected_text.endswith(("。", "！", "？", "\n")):
-            merged_text += " "
+        parts.append(correction.corrected_text)
+        if correction.corrected_text[-1:] not in _SENTENCE_ENDS:
+            parts.append(" ")
 
-    return merged_text.strip()
+    return "".join(parts).strip()
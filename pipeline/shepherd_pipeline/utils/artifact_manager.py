@@ -1,15 +1,24 @@
 """Artifact management for pipeline intermediate results."""
 
+import contextlib
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cache
 import hashlib
-import json
 from pathlib import Path
 import shutil
+import threading
+import time
 from typing import Any, TypeVar
+from uuid import uuid4
 
+import orjson
 from pydantic import BaseModel
 
+from shepherd_pipeline.services.llm_provider.schema import (
+    CorrectionResult,
+    TranscriptionResult,
+)
 from shepherd_pipeline.services.youtube.schema import AudioResult
 
 T = TypeVar("T", bound=BaseModel)
@@ -61,11 +70,14 @@ class ArtifactManager:
         # Ensure new directory structure exists
         (ARTIFACTS_DIR / "jobs").mkdir(parents=True, exist_ok=True)
 
+        # Chunks whose background deletion was cut short by the process exiting
+        _empty_trash(self.trash_folder())
+
     def get_artifact_key(self, **kwargs: str | float | int | None) -> str:
         """Generate artifact key from parameters."""
         # Create deterministic hash from parameters
-        content = json.dumps(kwargs, sort_keys=True)
-        return hashlib.md5(content.encode()).hexdigest()[:16]
+        content = orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(content).hexdigest()[:16]
 
     def audio_folder(self, key: str) -> Path:
         """Get the path to the youtube audio file."""
@@ -76,20 +88,104 @@ class ArtifactManager:
         metadata_path = self.audio_folder(key) / "metadata.json"
         if not metadata_path.exists():
             return None
-        metadata = AudioResult.model_validate_json(metadata_path.read_text())
+        metadata = AudioResult.model_validate_json(metadata_path.read_bytes())
         return metadata
 
     def save_audio(self, key: str, audio_result: AudioResult) -> None:
         """Save the youtube audio file."""
         metadata_path = self.audio_folder(key) / "metadata.json"
-        metadata_path.write_text(audio_result.model_dump_json())
+        metadata_path.write_bytes(orjson.dumps(audio_result.model_dump(mode="json")))
 
     def chunk_folder(self, audio_result: AudioResult, chunk_size_minutes: int) -> Path:
         audio_key = audio_result.file_path.split("/")[-1].split(".")[0]
         return ARTIFACTS_DIR / "chunks" / f"{chunk_size_minutes}min" / audio_key
 
+    def trash_folder(self) -> Path:
+        """Get the folder chunk folders are moved to before deletion."""
+        return ARTIFACTS_DIR / ".trash"
+
     def remove_chunks(self, audio_result: AudioResult, chunk_size_minutes: int) -> None:
-        """Remove the chunks for a given audio result."""
+        """Remove the chunks for a given audio result.
+
+        The folder is renamed into the trash, which is instant, and deleted in a
+        background thread so pipeline teardown doesn't wait on the disk.
+        """
         chunk_folder = self.chunk_folder(audio_result, chunk_size_minutes)
-        if chunk_folder.exists():
-            shutil.rmtree(chunk_folder)
+        if not chunk_folder.exists():
+            return
+        trash = self.trash_folder() / f"{chunk_folder.name}-{uuid4().hex}"
+        trash.parent.mkdir(parents=True, exist_ok=True)
+        chunk_folder.rename(trash)
+        threading.Thread(
+            target=shutil.rmtree,
+            args=(trash,),
+            kwargs={"ignore_errors": True},
+            daemon=True,
+        ).start()
+
+    def correction_path(self, key: str) -> Path:
+        """Get the path to a cached correction result."""
+        return ARTIFACTS_DIR / "correction_cache" / f"{key}.json"
+
+    def get_correction(
+        self, key: str, max_age_seconds: float | None = None
+    ) -> CorrectionResult | None:
+        """Get a cached correction result unless missing or older than max age."""
+        return _read_result(
+            self.correction_path(key), CorrectionResult, max_age_seconds
+        )
+
+    def save_correction(self, key: str, correction: CorrectionResult) -> None:
+        """Cache a correction result, replacing any previous entry atomically."""
+        _write_result(self.correction_path(key), correction)
+
+    def transcription_path(self, key: str) -> Path:
+        """Get the path to a cached chunk transcription."""
+        return ARTIFACTS_DIR / "transcription_cache" / f"{key}.json"
+
+    def get_transcription(
+        self, key: str, max_age_seconds: float | None = None
+    ) -> TranscriptionResult | None:
+        """Get a cached transcription unless missing or older than max age."""
+        return _read_result(
+            self.transcription_path(key), TranscriptionResult, max_age_seconds
+        )
+
+    def save_transcription(self, key: str, transcription: TranscriptionResult) -> None:
+        """Cache a chunk transcription, replacing any previous entry atomically."""
+        _write_result(self.transcription_path(key), transcription)
+
+
+@cache
+def _empty_trash(trash_folder: Path) -> None:
+    """Delete what earlier processes left in the trash, once per process.
+
+    Only the entries are removed, so another process can keep moving chunk
+    folders into the trash meanwhile.
+    """
+    with contextlib.suppress(FileNotFoundError):
+        for path in trash_folder.iterdir():
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def _read_result(  # noqa: UP047 - mypy still targets Python 3.11
+    path: Path, model: type[T], max_age_seconds: float | None
+) -> T | None:
+    """Load a cached result unless missing or older than max_age_seconds."""
+    try:
+        if (
+            max_age_seconds is not None
+            and time.time() - path.stat().st_mtime > max_age_seconds
+        ):
+            return None
+        return model.model_validate_json(path.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def _write_result(path: Path, result: BaseModel) -> None:
+    """Write a result via a temp file so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{uuid4().hex}.tmp")
+    tmp_path.write_bytes(orjson.dumps(result.model_dump(mode="json")))
+    tmp_path.replace(path)
@@ -1,64 +1,91 @@
 """Unified logging utilities for Prefect + Loguru integration."""
 
-import contextlib
+from functools import cache
+import logging
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger as loguru_logger
 from prefect import get_run_logger
-from prefect.exceptions import MissingContextError
+from prefect.context import FlowRunContext, TaskRunContext
 
 if TYPE_CHECKING:
-    from logging import Logger, LoggerAdapter
+    from loguru import Message, Record
 
+# Loguru levels without a stdlib counterpart
+_LOGURU_TO_LOGGING_LEVELS = {"SUCCESS": logging.INFO}
+
+# Only records logged through HybridLogger are forwarded to Prefect
+_hybrid_loguru_logger = loguru_logger.bind(hybrid=True)
+
+
+def _is_hybrid_record(record: "Record") -> bool:
+    """Check if a Loguru record was logged through HybridLogger."""
+    return bool(record["extra"].get("hybrid"))
+
+
+def in_prefect_run() -> bool:
+    """Check if the caller runs inside a Prefect task or flow run."""
+    return TaskRunContext.get() is not None or FlowRunContext.get() is not None
 
-class HybridLogger:
-    """Logger that combines Prefect's get_run_logger with Loguru for enhanced logging."""
 
-    def __init__(self) -> None:
-        """Initialize hybrid logger."""
-        self._prefect_logger: Logger | LoggerAdapter[Logger] | None = None
-        self._setup_prefect_logger()
+def _forward_to_prefect(message: "Message") -> None:
+    """Loguru sink that forwards records to the Prefect run logger, if any."""
+    if not in_prefect_run():
+        return
+    record = message.record
+    get_run_logger().log(
+        _LOGURU_TO_LOGGING_LEVELS.get(record["level"].name, record["level"].no),
+        record["message"],
+    )
 
-    def _setup_prefect_logger(self) -> None:
-        """Setup Prefect logger if in run context."""
-        with contextlib.suppress(MissingContextError):
-            self._prefect_logger = get_run_logger()
 
-    def _log_to_both(self, level: str, message: str, **kwargs: Any) -> None:  # noqa: ANN401
-        """Log to both Prefect and Loguru loggers."""
-        # Log to Prefect (for UI/backend integration)
-        if self._prefect_logger:
-            getattr(self._prefect_logger, level)(message, **kwargs)
+@cache
+def _add_prefect_sink() -> None:
+    """Bridge HybridLogger's Loguru records to Prefect, once per process."""
+    loguru_logger.add(
+        _forward_to_prefect,
+        level="DEBUG",
+        format="{message}",
+        filter=_is_hybrid_record,
+    )
 
-        # Log to Loguru (for enhanced local logging)
-        getattr(loguru_logger, level)(message, **kwargs)
+
+class HybridLogger:
+    """Logger that combines Prefect's get_run_logger with Loguru for enhanced logging.
+
+    Messages are logged through Loguru; inside a Prefect run they also reach the
+    run logger (for UI/backend integration) via a Loguru sink added on the first
+    message logged.
+    """
+
+    def _log(self, level: str, message: str, **kwargs: Any) -> None:  # noqa: ANN401
+        """Log a message at a Loguru level, adding the Prefect sink if needed."""
+        _add_prefect_sink()
+        _hybrid_loguru_logger.log(level, message, **kwargs)
 
     def info(self, message: str, **kwargs: Any) -> None:  # noqa: ANN401
         """Log info message."""
-        self._log_to_both("info", message, **kwargs)
+        self._log("INFO", message, **kwargs)
 
     def debug(self, message: str, **kwargs: Any) -> None:  # noqa: ANN401
         """Log debug message."""
-        self._log_to_both("debug", message, **kwargs)
+        self._log("DEBUG", message, **kwargs)
 
     def warning(self, message: str, **kwargs: Any) -> None:  # noqa: ANN401
         """Log warning message."""
-        self._log_to_both("warning", message, **kwargs)
+        self._log("WARNING", message, **kwargs)
 
     def error(self, message: str, **kwargs: Any) -> None:  # noqa: ANN401
         """Log error message."""
-        self._log_to_both("error", message, **kwargs)
+        self._log("ERROR", message, **kwargs)
 
     def critical(self, message: str, **kwargs: Any) -> None:  # noqa: ANN401
         """Log critical message."""
-        self._log_to_both("critical", message, **kwargs)
+        self._log("CRITICAL", message, **kwargs)
 
     def success(self, message: str, **kwargs: Any) -> None:  # noqa: ANN401
-        """Log success message (Loguru-specific level)."""
-        # Use info for Prefect, success for Loguru
-        if self._prefect_logger:
-            self._prefect_logger.info(message, **kwargs)
-        loguru_logger.success(message, **kwargs)
+        """Log success message (Loguru-specific level, info for Prefect)."""
+        self._log("SUCCESS", message, **kwargs)
 
 
 # Global hybrid logger instance
@@ -71,7 +98,11 @@ def get_hybrid_logger() -> HybridLogger:
 
 
 def refresh_logger() -> HybridLogger:
-    """Refresh logger to pick up new Prefect context."""
+    """Refresh logger to pick up new Prefect context.
+
+    The Prefect run logger is now resolved per message, so this is kept only for
+    backward compatibility.
+    """
     global hybrid_logger
     hybrid_logger = HybridLogger()
     return hybrid_logger
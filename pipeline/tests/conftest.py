@@ -1,6 +1,6 @@
 """Test configuration and fixtures."""
 
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
 from pathlib import Path
 import sys
 import tempfile
@@ -19,6 +19,8 @@ from shepherd_pipeline.services.llm_provider.schema import (
     SummaryResult,
     TranscriptionResult,
 )
+from shepherd_pipeline.services.mock_apis import MockSupabaseService
+from shepherd_pipeline.services.model_factory import AIProvider, ModelFactory
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
@@ -32,6 +34,26 @@ def prefect_test_fixture() -> Generator[None, None, None]:
         yield
 
 
+@pytest.fixture(scope="session")
+def warm_opencc() -> None:
+    """Load the OpenCC dictionaries once, before the first test that translates.
+
+    Imported here rather than at the top, so sessions whose tests don't request
+    this fixture never load OpenCC.
+    """
+    from shepherd_pipeline.services.translation_service import (
+        get_translation_service,
+    )
+
+    get_translation_service().to_traditional_chinese("预热")
+
+
+@pytest.fixture(scope="session")
+def supported_models() -> Mapping[AIProvider, tuple[str, ...]]:
+    """Supported model catalog, built once for read-only tests."""
+    return ModelFactory.get_supported_models()
+
+
 @pytest.fixture
 def temp_audio_file() -> Generator[str, None, None]:
     """Create a temporary audio file for testing."""
@@ -45,11 +67,17 @@ def temp_audio_file() -> Generator[str, None, None]:
     Path(temp_path).unlink(missing_ok=True)
 
 
+@pytest.fixture(scope="session")
+def youtube_url() -> HttpUrl:
+    """Sample YouTube URL, parsed once; HttpUrl is immutable so tests can share it."""
+    return HttpUrl("https://www.youtube.com/watch?v=test123")
+
+
 @pytest.fixture
-def sample_youtube_input() -> PipelineInput:
+def sample_youtube_input(youtube_url: HttpUrl) -> PipelineInput:
     """Sample YouTube pipeline input."""
     return PipelineInput(
-        youtube_url=HttpUrl("https://www.youtube.com/watch?v=test123"),
+        youtube_url=youtube_url,
         user_id="test_user",
         chunk_size_minutes=5,
         target_language="zh-TW",
@@ -134,3 +162,17 @@ def mock_supabase_service() -> AsyncMock:
         "total_jobs_today": 1,
     }
     return service
+
+
+@pytest.fixture(scope="session")
+async def prepopulated_supabase() -> tuple[MockSupabaseService, str]:
+    """Mock Supabase service with one job, shared by read-only tests."""
+    service = MockSupabaseService()
+    job_id = await service.create_job_record({"user_id": "test_user"})
+    return service, job_id
+
+
+@pytest.fixture
+def fresh_supabase() -> MockSupabaseService:
+    """Empty mock Supabase service for tests that modify jobs."""
+    return MockSupabaseService()
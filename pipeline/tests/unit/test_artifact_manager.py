@@ -0,0 +1,173 @@
+"""Test artifact manager result caches."""
+
+import os
+from pathlib import Path
+import time
+
+import pytest
+from pytest_mock import MockerFixture
+
+from shepherd_pipeline.services.llm_provider.schema import (
+    CorrectionResult,
+    TranscriptionResult,
+)
+from shepherd_pipeline.services.youtube.schema import AudioResult
+from shepherd_pipeline.utils import artifact_manager
+from shepherd_pipeline.utils.artifact_manager import ArtifactManager
+
+
+@pytest.fixture
+def manager(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ArtifactManager:
+    """Artifact manager writing into a temporary directory."""
+    monkeypatch.setattr(artifact_manager, "ARTIFACTS_DIR", tmp_path)
+    return ArtifactManager()
+
+
+@pytest.fixture
+def correction() -> CorrectionResult:
+    """Sample correction result."""
+    return CorrectionResult(
+        original_text="這是測試文字",
+        corrected_text="這是測試文字。",
+        language="zh-TW",
+        model="mistral-small-latest",
+    )
+
+
+@pytest.fixture
+def transcription() -> TranscriptionResult:
+    """Sample transcription result."""
+    return TranscriptionResult(
+        raw_text="這是測試文字", language="zh-TW", model="voxtral-mini-latest"
+    )
+
+
+def _age(path: Path, seconds: float) -> None:
+    """Backdate a file's modification time."""
+    mtime = time.time() - seconds
+    os.utime(path, (mtime, mtime))
+
+
+class TestCorrectionCache:
+    """Test the correction result cache."""
+
+    def test_round_trip(
+        self, manager: ArtifactManager, correction: CorrectionResult
+    ) -> None:
+        """Test a saved correction loads back unchanged."""
+        manager.save_correction("key", correction)
+
+        assert manager.get_correction("key") == correction
+        # Written via a temp file that is renamed into place
+        assert [
+            path.name for path in manager.correction_path("key").parent.iterdir()
+        ] == ["key.json"]
+
+    def test_miss(self, manager: ArtifactManager, correction: CorrectionResult) -> None:
+        """Test unknown keys are cache misses."""
+        manager.save_correction("key", correction)
+
+        assert manager.get_correction("other") is None
+
+    def test_hit_within_max_age(
+        self, manager: ArtifactManager, correction: CorrectionResult
+    ) -> None:
+        """Test entries younger than max_age_seconds are returned."""
+        manager.save_correction("key", correction)
+        _age(manager.correction_path("key"), 30)
+
+        assert manager.get_correction("key", max_age_seconds=60) == correction
+
+    def test_expired(
+        self, manager: ArtifactManager, correction: CorrectionResult
+    ) -> None:
+        """Test entries older than max_age_seconds are ignored."""
+        manager.save_correction("key", correction)
+        _age(manager.correction_path("key"), 120)
+
+        assert manager.get_correction("key", max_age_seconds=60) is None
+        # Without a max age the entry is still served
+        assert manager.get_correction("key") == correction
+
+    def test_save_replaces(
+        self, manager: ArtifactManager, correction: CorrectionResult
+    ) -> None:
+        """Test saving the same key again replaces the entry."""
+        manager.save_correction("key", correction)
+        updated = correction.model_copy(update={"corrected_text": "更新。"})
+        manager.save_correction("key", updated)
+
+        assert manager.get_correction("key") == updated
+
+
+class TestTranscriptionCache:
+    """Test the transcription result cache."""
+
+    def test_round_trip(
+        self, manager: ArtifactManager, transcription: TranscriptionResult
+    ) -> None:
+        """Test a saved transcription loads back unchanged."""
+        manager.save_transcription("key", transcription)
+
+        assert manager.get_transcription("key") == transcription
+
+    def test_miss(self, manager: ArtifactManager) -> None:
+        """Test a missing entry, including a missing cache directory, is a miss."""
+        assert manager.get_transcription("key") is None
+        assert manager.get_transcription("key", max_age_seconds=60) is None
+
+    def test_expired(
+        self, manager: ArtifactManager, transcription: TranscriptionResult
+    ) -> None:
+        """Test entries older than max_age_seconds are ignored."""
+        manager.save_transcription("key", transcription)
+        _age(manager.transcription_path("key"), 120)
+
+        assert manager.get_transcription("key", max_age_seconds=60) is None
+        assert manager.get_transcription("key", max_age_seconds=600) == transcription
+
+
+class TestRemoveChunks:
+    """Test removing chunk folders through the trash."""
+
+    def test_deletes_only_its_folder(
+        self, manager: ArtifactManager, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Test the background deletion targets just the folder moved to the trash."""
+        thread = mocker.patch.object(artifact_manager.threading, "Thread")
+        audio_result = AudioResult(
+            title="Test",
+            duration=60.0,
+            file_path=str(tmp_path / "downloads" / "key" / "audio.mp3"),
+            format="mp3",
+            sample_rate=44100,
+            file_size=0,
+            original_duration=60.0,
+        )
+        chunk_folder = manager.chunk_folder(audio_result, 10)
+        chunk_folder.mkdir(parents=True)
+        (chunk_folder / "chunk_0.mp3").touch()
+        # Another job's folder, already being deleted by its own thread
+        other = manager.trash_folder() / "other"
+        other.mkdir(parents=True)
+
+        manager.remove_chunks(audio_result, 10)
+
+        assert not chunk_folder.exists()
+        (trash,) = thread.call_args.kwargs["args"]
+        assert trash.parent == manager.trash_folder()
+        assert (trash / "chunk_0.mp3").exists()
+        thread.return_value.start.assert_called_once()
+        assert other.exists()
+
+    def test_leftover_trash_emptied_on_startup(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test trash left by an earlier process is deleted by the first manager."""
+        monkeypatch.setattr(artifact_manager, "ARTIFACTS_DIR", tmp_path)
+        leftover = tmp_path / ".trash" / "audio-1234"
+        leftover.mkdir(parents=True)
+
+        ArtifactManager()
+
+        assert not leftover.exists()
@@ -0,0 +1,128 @@
+"""Test audio processing tasks."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from shepherd_pipeline.services.youtube.schema import AudioResult
+from shepherd_pipeline.tasks import audio_tasks
+from shepherd_pipeline.tasks.audio_tasks import _segment_audio_with_ffmpeg, chunk_audio
+from shepherd_pipeline.utils import artifact_manager
+
+
+def _fake_ffmpeg(
+    mocker: MockerFixture, returncode: int = 0, rows: list[str] | None = None
+) -> AsyncMock:
+    """Patch the ffmpeg subprocess.
+
+    On success it writes rows as the segment CSV; on failure it leaves a partial
+    first segment behind.
+    """
+
+    async def create_subprocess_exec(*args: str, **_kwargs: Any) -> MagicMock:  # noqa: ANN401
+        if returncode == 0:
+            segment_list = Path(args[args.index("-segment_list") + 1])
+            segment_list.write_text("".join(f"{row}\n" for row in rows or []))
+        else:
+            Path(args[-1] % 0).touch()
+        process = MagicMock(returncode=returncode)
+        process.communicate = AsyncMock(return_value=(b"", b"invalid data"))
+        return process
+
+    return mocker.patch.object(
+        audio_tasks.asyncio,
+        "create_subprocess_exec",
+        AsyncMock(side_effect=create_subprocess_exec),
+    )
+
+
+class TestSegmentAudioWithFfmpeg:
+    """Test splitting audio with ffmpeg's segment muxer."""
+
+    async def test_segment_list_to_chunks(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Test the segment CSV rows become chunks in order."""
+        source = tmp_path / "audio.mp3"
+        subprocess = _fake_ffmpeg(
+            mocker,
+            rows=[
+                "chunk_x_0.mp3,0.000000,600.024000",
+                "chunk_x_1.mp3,600.024000,1200.000000",
+                "chunk_x_2.mp3,1200.000000,1325.500000",
+            ],
+        )
+
+        chunks = await _segment_audio_with_ffmpeg("ffmpeg", source, tmp_path, 10)
+
+        args = subprocess.call_args.args
+        assert args[args.index("-segment_time") + 1] == "600"
+        assert [chunk.chunk_id for chunk in chunks] == ["chunk_0", "chunk_1", "chunk_2"]
+        assert [(chunk.start_time, chunk.end_time) for chunk in chunks] == [
+            (0.0, 600.024),
+            (600.024, 1200.0),
+            (1200.0, 1325.5),
+        ]
+        assert [chunk.file_path for chunk in chunks] == [
+            str(tmp_path / f"chunk_x_{i}.mp3") for i in range(3)
+        ]
+        assert chunks[2].duration == pytest.approx(125.5)
+        assert all(chunk.source_file == str(source) for chunk in chunks)
+        # The segment list is removed once parsed
+        assert not list(tmp_path.glob("*.csv"))
+
+    async def test_failure_raises(self, tmp_path: Path, mocker: MockerFixture) -> None:
+        """Test a non-zero ffmpeg exit raises with its stderr and cleans up."""
+        _fake_ffmpeg(mocker, returncode=1)
+
+        with pytest.raises(RuntimeError, match="invalid data"):
+            await _segment_audio_with_ffmpeg(
+                "ffmpeg", tmp_path / "audio.mp3", tmp_path, 10
+            )
+
+        # Partial segments are cleaned up
+        assert not list(tmp_path.iterdir())
+
+
+class TestChunkAudio:
+    """Test chunk_audio."""
+
+    # Tasks run outside a flow here, so Prefect has no flow run to log to
+    @pytest.mark.filterwarnings("ignore:Logger 'prefect.task_runs':UserWarning")
+    async def test_ffmpeg_failure_falls_back_to_pydub(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        """Test chunking falls back to pydub when ffmpeg exits non-zero."""
+        monkeypatch.setattr(artifact_manager, "ARTIFACTS_DIR", tmp_path)
+        source = tmp_path / "audio.mp3"
+        source.touch()
+        audio_result = AudioResult(
+            title="Test",
+            duration=150.0,
+            file_path=str(source),
+            format="mp3",
+            sample_rate=44100,
+            file_size=0,
+            original_duration=150.0,
+        )
+        mocker.patch.object(audio_tasks.shutil, "which", return_value="ffmpeg")
+        subprocess = _fake_ffmpeg(mocker, returncode=1)
+        audio = MagicMock()
+        audio.__len__.return_value = 150_000  # pydub lengths are in milliseconds
+        mocker.patch.object(audio_tasks.AudioSegment, "from_file", return_value=audio)
+        pydub_chunks = [MagicMock() for _ in range(3)]
+        mocker.patch.object(audio_tasks, "make_chunks", return_value=pydub_chunks)
+
+        chunks = await chunk_audio(audio_result, chunk_size_minutes=1)
+
+        subprocess.assert_awaited_once()
+        assert [(chunk.start_time, chunk.end_time) for chunk in chunks] == [
+            (0.0, 60.0),
+            (60.0, 120.0),
+            (120.0, 150.0),
+        ]
+        for chunk, pydub_chunk in zip(chunks, pydub_chunks, strict=True):
+            pydub_chunk.export.assert_called_once_with(chunk.file_path, format="mp3")
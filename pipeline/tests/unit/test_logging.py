@@ -0,0 +1,35 @@
+"""Test hybrid Prefect + Loguru logging."""
+
+import logging
+
+from prefect import flow
+from pytest_mock import MockerFixture
+
+from shepherd_pipeline.utils import logging as hybrid_logging
+
+
+class TestHybridLogger:
+    """Test HybridLogger."""
+
+    def test_module_logger_forwards_to_prefect(self, mocker: MockerFixture) -> None:
+        """Test the module-level logger reaches Prefect without get_hybrid_logger()."""
+        run_logger = mocker.patch.object(hybrid_logging, "get_run_logger")
+
+        @flow
+        def log_in_flow() -> bool:
+            hybrid_logging.hybrid_logger.info("inside the flow")
+            return hybrid_logging.in_prefect_run()
+
+        assert log_in_flow() is True
+        run_logger.return_value.log.assert_called_once_with(
+            logging.INFO, "inside the flow"
+        )
+
+    def test_outside_run_not_forwarded(self, mocker: MockerFixture) -> None:
+        """Test messages logged outside a Prefect run stay in Loguru."""
+        run_logger = mocker.patch.object(hybrid_logging, "get_run_logger")
+
+        hybrid_logging.hybrid_logger.warning("outside any run")
+
+        assert hybrid_logging.in_prefect_run() is False
+        run_logger.assert_not_called()
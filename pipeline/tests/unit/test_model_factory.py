@@ -1,5 +1,9 @@
 """Test model factory."""
 
+from collections.abc import Mapping
+
+import pytest
+
 from shepherd_pipeline.services.llm_provider.mistral_service import MistralService
 from shepherd_pipeline.services.llm_provider.mock import MockAIService
 from shepherd_pipeline.services.llm_provider.openai_service import OpenAIService
@@ -9,74 +13,69 @@ from shepherd_pipeline.services.model_factory import AIProvider, ModelFactory, T
 class TestModelFactory:
     """Test ModelFactory."""
 
-    def test_get_provider_for_model_openai(self) -> None:
-        """Test OpenAI model provider detection."""
-        assert ModelFactory.get_provider_for_model("gpt-4.1-nano") == AIProvider.OPENAI
-        assert ModelFactory.get_provider_for_model("gpt-4o-mini") == AIProvider.OPENAI
-        assert ModelFactory.get_provider_for_model("gpt-4.1-mini") == AIProvider.OPENAI
-
-    def test_get_provider_for_model_mistral(self) -> None:
-        """Test Mistral model provider detection."""
-        assert (
-            ModelFactory.get_provider_for_model("mistral-small-latest")
-            == AIProvider.MISTRAL
-        )
-        assert (
-            ModelFactory.get_provider_for_model("mistral-medium-2505")
-            == AIProvider.MISTRAL
-        )
+    @pytest.mark.parametrize(
+        ("model", "provider"),
+        [
+            ("gpt-4.1-nano", AIProvider.OPENAI),
+            ("gpt-4o-mini", AIProvider.OPENAI),
+            ("gpt-4.1-mini", AIProvider.OPENAI),
+            ("mistral-small-latest", AIProvider.MISTRAL),
+            ("mistral-medium-2505", AIProvider.MISTRAL),
+            ("voxtral-mini-latest", AIProvider.MISTRAL),
+            # Unknown models default to Mistral
+            ("unknown-model", AIProvider.MISTRAL),
+        ],
+    )
+    def test_get_provider_for_model(self, model: str, provider: AIProvider) -> None:
+        """Test provider detection for a model."""
+        assert ModelFactory.get_provider_for_model(model) == provider
+
+    @pytest.mark.parametrize(
+        ("factory", "model", "service_cls"),
+        [
+            ("create_text_processor", "mock-model", MockAIService),
+            ("create_text_processor", "gpt-4o-mini", OpenAIService),
+            ("create_text_processor", "mistral-small-latest", MistralService),
+            ("create_summarization_service", "mock-model", MockAIService),
+            ("create_summarization_service", "gpt-4o-mini", OpenAIService),
+            ("create_summarization_service", "mistral-small-latest", MistralService),
+            ("create_transcription_service", "mock-model", MockAIService),
+            ("create_transcription_service", "gpt-4o-mini-transcribe", OpenAIService),
+            # Unified MistralService with Voxtral transcription capability
+            ("create_transcription_service", "voxtral-mini-latest", MistralService),
+        ],
+    )
+    def test_create_service(self, factory: str, model: str, service_cls: type) -> None:
+        """Test each factory method dispatches a model to its provider's service."""
+        assert isinstance(getattr(ModelFactory, factory)(model), service_cls)
+
+    def test_services_are_shared_per_provider(self) -> None:
+        """Test models of the same provider share one service instance."""
+        processor = ModelFactory.create_text_processor("gpt-4o-mini")
+        assert ModelFactory.create_summarization_service("gpt-4.1-nano") is processor
         assert (
-            ModelFactory.get_provider_for_model("voxtral-mini-latest")
-            == AIProvider.MISTRAL
+            ModelFactory.create_transcription_service("gpt-4o-transcribe") is processor
         )
-
-    def test_get_provider_for_model_unknown(self) -> None:
-        """Test unknown model defaults to Mistral."""
-        assert (
-            ModelFactory.get_provider_for_model("unknown-model") == AIProvider.MISTRAL
+        assert ModelFactory.create_text_processor("unknown-model") is (
+            ModelFactory.create_text_processor("mistral-small-latest")
         )
 
-    def test_create_text_processor_mock(self) -> None:
-        """Test creating mock text processor."""
-        processor = ModelFactory.create_text_processor("mock-model")
-        assert isinstance(processor, MockAIService)
-
-    def test_create_text_processor_openai(self) -> None:
-        """Test creating OpenAI text processor."""
-        processor = ModelFactory.create_text_processor("gpt-4o-mini")
-        assert isinstance(processor, OpenAIService)
-
-    def test_create_text_processor_mistral(self) -> None:
-        """Test creating Mistral text processor."""
-        processor = ModelFactory.create_text_processor("mistral-small-latest")
-        assert isinstance(processor, MistralService)
-
-    def test_create_summarization_service_mock(self) -> None:
-        """Test creating mock summarization service."""
-        service = ModelFactory.create_summarization_service("mock-model")
-        assert isinstance(service, MockAIService)
-
-    def test_create_summarization_service_openai(self) -> None:
-        """Test creating OpenAI summarization service."""
-        service = ModelFactory.create_summarization_service("gpt-4o-mini")
-        assert isinstance(service, OpenAIService)
-
-    def test_create_summarization_service_mistral(self) -> None:
-        """Test creating Mistral summarization service."""
-        service = ModelFactory.create_summarization_service("mistral-small-latest")
-        assert isinstance(service, MistralService)
-
-    def test_get_supported_models(self) -> None:
+    def test_get_supported_models(
+        self, supported_models: Mapping[AIProvider, tuple[str, ...]]
+    ) -> None:
         """Test getting supported models."""
-        models = ModelFactory.get_supported_models()
+        assert AIProvider.OPENAI in supported_models
+        assert AIProvider.MISTRAL in supported_models
+        assert AIProvider.MOCK in supported_models
 
-        assert AIProvider.OPENAI in models
-        assert AIProvider.MISTRAL in models
-        assert AIProvider.MOCK in models
+        assert "gpt-4o-mini" in supported_models[AIProvider.OPENAI]
+        assert "mistral-small-latest" in supported_models[AIProvider.MISTRAL]
+        assert "mock-model" in supported_models[AIProvider.MOCK]
 
-        assert "gpt-4o-mini" in models[AIProvider.OPENAI]
-        assert "mistral-small-latest" in models[AIProvider.MISTRAL]
-        assert "mock-model" in models[AIProvider.MOCK]
+        # Shared between callers, so it can't be modified in place
+        assert isinstance(supported_models[AIProvider.OPENAI], tuple)
+        with pytest.raises(TypeError):
+            supported_models[AIProvider.OPENAI] = ()  # type: ignore[index]
 
     def test_validate_model_valid(self) -> None:
         """Test validating valid models."""
@@ -114,46 +113,35 @@ class TestModelFactory:
             )
             == "voxtral-mini-latest"
         )
-
-    def test_validate_model_with_task_type(self) -> None:
-        """Test new validate_model method with task types."""
-        # Valid combinations
         assert (
-            ModelFactory.validate_model(
-                AIProvider.OPENAI, "gpt-4o-mini", TaskType.CORRECTION
-            )
-            is True
-        )
-        assert (
-            ModelFactory.validate_model(
-                AIProvider.MISTRAL, "voxtral-mini-latest", TaskType.TRANSCRIPTION
+            ModelFactory.get_default_model_for_provider(
+                AIProvider.OPENAI, TaskType.TRANSCRIPTION
             )
-            is True
-        )
-        assert (
-            ModelFactory.validate_model(None, "gpt-4o-mini", TaskType.CORRECTION)
-            is True
+            == "gpt-4o-mini-transcribe"
         )
 
-        # Invalid combinations
-        assert (
-            ModelFactory.validate_model(
-                AIProvider.OPENAI, "voxtral-mini-latest", TaskType.TRANSCRIPTION
-            )
-            is False
-        )
-        assert (
-            ModelFactory.validate_model(
-                AIProvider.MISTRAL, "gpt-4o-mini", TaskType.CORRECTION
-            )
-            is False
-        )
-        assert (
-            ModelFactory.validate_model(
-                AIProvider.OPENAI, "unknown-model", TaskType.CORRECTION
-            )
-            is False
-        )
+    @pytest.mark.parametrize(
+        ("provider", "model", "task_type", "expected"),
+        [
+            # Valid combinations
+            (AIProvider.OPENAI, "gpt-4o-mini", TaskType.CORRECTION, True),
+            (AIProvider.MISTRAL, "voxtral-mini-latest", TaskType.TRANSCRIPTION, True),
+            (None, "gpt-4o-mini", TaskType.CORRECTION, True),
+            # Invalid combinations
+            (AIProvider.OPENAI, "voxtral-mini-latest", TaskType.TRANSCRIPTION, False),
+            (AIProvider.MISTRAL, "gpt-4o-mini", TaskType.CORRECTION, False),
+            (AIProvider.OPENAI, "unknown-model", TaskType.CORRECTION, False),
+        ],
+    )
+    def test_validate_model_with_task_type(
+        self,
+        provider: AIProvider | None,
+        model: str,
+        task_type: TaskType,
+        expected: bool,
+    ) -> None:
+        """Test new validate_model method with task types."""
+        assert ModelFactory.validate_model(provider, model, task_type) is expected
 
     def test_get_models_by_provider_and_task(self) -> None:
         """Test getting models by provider and task type."""
@@ -163,26 +151,10 @@ class TestModelFactory:
         assert "gpt-4o-mini" in openai_correction
         assert "gpt-4.1-nano" in openai_correction
         assert "voxtral-mini-latest" not in openai_correction
+        assert isinstance(openai_correction, tuple)
 
         mistral_transcription = ModelFactory.get_models(
             AIProvider.MISTRAL, TaskType.TRANSCRIPTION
         )
         assert "voxtral-mini-latest" in mistral_transcription
         assert "mistral-small-latest" not in mistral_transcription
-
-    def test_create_transcription_service_mock(self) -> None:
-        """Test creating mock transcription service."""
-        service = ModelFactory.create_transcription_service("mock-model")
-        assert isinstance(service, MockAIService)
-
-    def test_create_transcription_service_openai(self) -> None:
-        """Test creating OpenAI transcription service."""
-        service = ModelFactory.create_transcription_service("gpt-4o-mini-transcribe")
-        assert isinstance(service, OpenAIService)
-
-    def test_create_transcription_service_mistral_voxtral(self) -> None:
-        """Test creating Mistral transcription service (unified with Voxtral)."""
-        service = ModelFactory.create_transcription_service("voxtral-mini-latest")
-        # Should return unified MistralService with transcription capability
-        assert isinstance(service, MistralService)
-        assert hasattr(service, "transcribe_audio")
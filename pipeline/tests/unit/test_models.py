@@ -1,5 +1,6 @@
 """Test pipeline data models."""
 
+from typing import Any
 from uuid import UUID
 
 from pydantic import HttpUrl, ValidationError
@@ -16,13 +17,20 @@ from shepherd_pipeline.services.llm_provider.schema import (
 )
 
 
+def _make_result(**kwargs: Any) -> PipelineResult:
+    """Build a PipelineResult without validation, for tests of its properties."""
+    return PipelineResult.model_construct(
+        job_id=UUID("12345678-1234-5678-1234-567812345678"), **kwargs
+    )
+
+
 class TestPipelineInput:
     """Test PipelineInput model."""
 
-    def test_youtube_input_valid(self) -> None:
+    def test_youtube_input_valid(self, youtube_url: HttpUrl) -> None:
         """Test valid YouTube input."""
         input_data = PipelineInput(
-            youtube_url=HttpUrl("https://www.youtube.com/watch?v=test123"),
+            youtube_url=youtube_url,
             user_id="test_user",
         )
 
@@ -30,6 +38,17 @@ class TestPipelineInput:
         assert input_data.user_id == "test_user"
         assert isinstance(input_data.job_id, UUID)
 
+    def test_youtube_input_from_json(self) -> None:
+        """Test YouTube input parsed straight from a JSON payload."""
+        input_data = PipelineInput.model_validate_json(
+            '{"youtube_url": "https://www.youtube.com/watch?v=test123",'
+            ' "user_id": "test_user"}'
+        )
+
+        assert str(input_data.youtube_url) == "https://www.youtube.com/watch?v=test123"
+        assert input_data.user_id == "test_user"
+        assert isinstance(input_data.job_id, UUID)
+
     def test_youtube_input_missing_url(self) -> None:
         """Test YouTube input without URL is valid - inputs are optional."""
         # PipelineInput now accepts multiple input types, all optional
@@ -39,24 +58,15 @@ class TestPipelineInput:
         assert isinstance(input_data.job_id, UUID)
 
     def test_chunk_size_validation(self) -> None:
-        """Test chunk size validation."""
-        # Valid chunk size
+        """Test a valid chunk size is accepted."""
         input_data = PipelineInput(text_content="Test", chunk_size_minutes=15)
         assert input_data.chunk_size_minutes == 15
 
-        # Invalid chunk size (too small)
-        with pytest.raises(ValidationError):
-            PipelineInput(
-                text_content="Test",
-                chunk_size_minutes=0,
-            )
-
-        # Invalid chunk size (too large)
+    @pytest.mark.parametrize("chunk_size", [-1, 0, 31, 40, 1000])
+    def test_chunk_size_invalid(self, chunk_size: int) -> None:
+        """Test chunk sizes outside 1-30 minutes are rejected."""
         with pytest.raises(ValidationError):
-            PipelineInput(
-                text_content="Test",
-                chunk_size_minutes=40,
-            )
+            PipelineInput(text_content="Test", chunk_size_minutes=chunk_size)
 
 
 class TestTranscriptionResult:
@@ -93,10 +103,7 @@ class TestPipelineResult:
     def test_is_complete_property(self) -> None:
         """Test is_complete property."""
         # Completed job
-        result = PipelineResult(
-            job_id=UUID("12345678-1234-5678-1234-567812345678"),
-            status=JobStatus.COMPLETED,
-        )
+        result = _make_result(status=JobStatus.COMPLETED)
         assert result.is_complete is True
 
         # Failed job
@@ -117,10 +124,7 @@ class TestPipelineResult:
 
     def test_duration_minutes_property(self) -> None:
         """Test duration_minutes property."""
-        result = PipelineResult(
-            job_id=UUID("12345678-1234-5678-1234-567812345678"),
-            status=JobStatus.COMPLETED,
-        )
+        result = _make_result(status=JobStatus.COMPLETED)
 
         # No processing duration
         assert result.duration_minutes is None
@@ -144,6 +148,17 @@ class TestSummaryResult:
         assert result.model == "gpt-4"
         assert result.custom_instructions is None
 
+    def test_summary_from_json(self) -> None:
+        """Test summary result parsed straight from a JSON payload."""
+        result = SummaryResult.model_validate_json(
+            b'{"summary": "Test summary content", "word_count": 3, "model": "gpt-4"}'
+        )
+
+        assert result.summary == "Test summary content"
+        assert result.word_count == 3
+        assert result.model == "gpt-4"
+        assert result.custom_instructions is None
+
     def test_with_custom_instructions(self) -> None:
         """Test summary with custom instructions."""
         result = SummaryResult(
@@ -1,16 +1,21 @@
 """Test mock services."""
 
+import asyncio
+import threading
+
+import httpx
 import pytest
+from pytest_mock import MockerFixture
 
-from shepherd_pipeline.services.llm_provider import MockAIService
+from shepherd_pipeline.services.llm_provider import MockAIService, OpenAIService
 from shepherd_pipeline.services.mock_apis import MockSupabaseService
+from shepherd_pipeline.services.model_factory import ModelFactory
 from shepherd_pipeline.services.youtube.mock import MockYouTubeService
 
 
 class TestMockYouTubeService:
     """Test MockYouTubeService."""
 
-    @pytest.mark.asyncio
     async def test_download_audio(self) -> None:
         """Test YouTube audio download."""
         service = MockYouTubeService()
@@ -28,45 +33,43 @@ class TestMockYouTubeService:
 class TestMockAIService:
     """Test unified MockAIService."""
 
-    @pytest.mark.asyncio
-    async def test_transcribe_audio(self) -> None:
-        """Test OpenAI-style audio transcription."""
-        service = MockAIService()
+    @pytest.fixture
+    def mock_ai_service(self) -> MockAIService:
+        """Mock AI service instance."""
+        return MockAIService()
 
-        result = await service.transcribe_audio("/tmp/audio_file.mp3", "zh")
+    async def test_transcribe_audio(self, mock_ai_service: MockAIService) -> None:
+        """Test OpenAI-style audio transcription."""
+        result = await mock_ai_service.transcribe_audio("/tmp/audio_file.mp3", "zh")
 
         assert isinstance(result.raw_text, str)
-        assert len(result.raw_text) > 0
+        assert result.raw_text
         assert result.language == "zh"
         assert result.model == "mock-model"
         assert result.failure_reason is None
 
-    @pytest.mark.asyncio
-    async def test_correct_text(self) -> None:
+    async def test_correct_text(self, mock_ai_service: MockAIService) -> None:
         """Test text correction."""
-        service = MockAIService()
-
         original_text = "這是測試文字"
-        result = await service.correct_text(
+        result = await mock_ai_service.correct_text(
             original_text, "zh-TW", "mistral-small-latest"
         )
 
         assert result.original_text == original_text
         assert isinstance(result.corrected_text, str)
-        assert len(result.corrected_text) > 0
+        assert result.corrected_text
         assert result.language == "zh-TW"
         assert result.model == "mistral-small-latest"
         # Should end with punctuation
         assert result.corrected_text.endswith(("。", "！", "？", "：", "；"))
 
-    @pytest.mark.asyncio
-    async def test_correct_text_christian_context(self) -> None:
+    async def test_correct_text_christian_context(
+        self, mock_ai_service: MockAIService
+    ) -> None:
         """Test text correction with Christian terminology."""
-        service = MockAIService()
-
         # Test text with simplified Chinese Christian terms
         original_text = "神的恩典 教会的弟兄姊妹 祷告和见证"
-        result = await service.correct_text(
+        result = await mock_ai_service.correct_text(
             original_text, "zh-TW", "mistral-small-latest"
         )
 
@@ -76,24 +79,21 @@ class TestMockAIService:
         assert "禱告" in result.corrected_text or "祷告" in result.corrected_text
         assert "見證" in result.corrected_text or "见证" in result.corrected_text
 
-    @pytest.mark.asyncio
-    async def test_summarize_text(self) -> None:
+    async def test_summarize_text(self, mock_ai_service: MockAIService) -> None:
         """Test text summarization."""
-        service = MockAIService()
-
         text = (
             "今天我要跟大家分享關於神的恩典的見證。神在我生命中做了奇妙的工作，"
             "透過禱告和讀經讓我更親近祂。教會的弟兄姊妹也給了我很多支持和鼓勵。"
         )
 
-        result = await service.summarize_text(
+        result = await mock_ai_service.summarize_text(
             text,
             model="mistral-small-latest",
             instructions="這是一天基督教的講道，請整理三段式重點摘要",
         )
 
         assert isinstance(result.summary, str)
-        assert len(result.summary) > 0
+        assert result.summary
         assert result.word_count > 0
         assert result.model == "mistral-small-latest"
         # Should contain Christian terminology
@@ -102,80 +102,234 @@ class TestMockAIService:
             for term in ["基督", "信仰", "神", "上帝", "教會", "禱告"]
         )
 
-    @pytest.mark.asyncio
-    async def test_summarize_text_with_word_limit(self) -> None:
+    @pytest.mark.parametrize(
+        ("text", "word_limit", "model", "max_word_count"),
+        [
+            # In Chinese, each character is roughly equivalent to a word, so
+            # allow some flexibility over the requested limit
+            (
+                "長文字測試內容，需要被總結為更短的摘要。",
+                20,
+                "mistral-small-latest",
+                30,
+            ),
+            ("長文字測試內容", 5, "gpt-4", 10),
+        ],
+    )
+    async def test_summarize_text_with_word_limit(
+        self,
+        mock_ai_service: MockAIService,
+        text: str,
+        word_limit: int,
+        model: str,
+        max_word_count: int,
+    ) -> None:
         """Test summarization with word limit."""
-        service = MockAIService()
-
-        text = "長文字測試內容，需要被總結為更短的摘要。"
-        result = await service.summarize_text(
-            text, word_limit=20, model="mistral-small-latest"
+        result = await mock_ai_service.summarize_text(
+            text, word_limit=word_limit, model=model
         )
 
-        # Should respect word limit (approximately) - check word count for Chinese
-        # In Chinese, each character is roughly equivalent to a word
-        assert result.word_count <= 30  # Allow some flexibility for Chinese text
-
-    @pytest.mark.asyncio
-    async def test_summarize_text_with_instructions(self) -> None:
+        # Should respect word limit (approximately)
+        assert result.word_count <= max_word_count
+
+    @pytest.mark.parametrize(
+        ("text", "instructions", "model"),
+        [
+            (
+                "今天分享信仰見證，談到神的恩典和教會生活。",
+                "請重點關注屬靈成長的部分",
+                "mistral-small-latest",
+            ),
+            ("測試文字", "請重點關注技術細節", "gpt-4"),
+        ],
+    )
+    async def test_summarize_text_with_instructions(
+        self,
+        mock_ai_service: MockAIService,
+        text: str,
+        instructions: str,
+        model: str,
+    ) -> None:
         """Test summarization with custom instructions."""
-        service = MockAIService()
-
-        instructions = "請重點關注屬靈成長的部分"
-        text = "今天分享信仰見證，談到神的恩典和教會生活。"
-
-        result = await service.summarize_text(
-            text, instructions=instructions, model="mistral-small-latest"
+        result = await mock_ai_service.summarize_text(
+            text, instructions=instructions, model=model
         )
 
         assert result.custom_instructions == instructions
 
-    @pytest.mark.asyncio
-    async def test_summarize_text_general_mode(self) -> None:
+    async def test_summarize_text_general_mode(
+        self, mock_ai_service: MockAIService
+    ) -> None:
         """Test text summarization in general mode (non-Christian)."""
-        service = MockAIService()
-
-        result = await service.summarize_text(
+        result = await mock_ai_service.summarize_text(
             "這是一段很長的測試文字，需要被總結成較短的摘要。", model="gpt-4"
         )
 
         assert isinstance(result.summary, str)
-        assert len(result.summary) > 0
+        assert result.summary
         assert result.word_count > 0
         assert result.model == "gpt-4"
 
-    @pytest.mark.asyncio
-    async def test_summarize_with_word_limit(self) -> None:
-        """Test summarization with word limit."""
-        service = MockAIService()
-
-        result = await service.summarize_text(
-            "長文字測試內容", word_limit=5, model="gpt-4"
-        )
-
-        # Should respect word limit (approximately)
-        assert result.word_count <= 10  # Allow some flexibility for Chinese text
 
-    @pytest.mark.asyncio
-    async def test_summarize_with_instructions(self) -> None:
-        """Test summarization with custom instructions."""
-        service = MockAIService()
+class TestOpenAIService:
+    """Test OpenAIService response handling."""
 
-        instructions = "請重點關注技術細節"
-        result = await service.summarize_text(
-            "測試文字", instructions=instructions, model="gpt-4"
+    async def test_correct_text_prompt_cache_key(self, mocker: MockerFixture) -> None:
+        """Test correction requests share a prompt cache key across chunks."""
+        service = OpenAIService()
+        request = mocker.patch.object(
+            service,
+            "_make_chat_request",
+            return_value={"choices": [{"message": {"content": "修正"}}]},
         )
 
-        assert result.custom_instructions == instructions
+        await service.correct_text("第一段")
+        await service.correct_text("第二段")
+
+        first, second = request.call_args_list
+        # Greedy decoding keeps corrections reproducible for the correction cache
+        assert first.kwargs["temperature"] == 0
+        assert first.args[0][0]["role"] == "system"
+        assert first.kwargs["prompt_cache_key"]
+        assert first.kwargs["prompt_cache_key"] == second.kwargs["prompt_cache_key"]
+
+    async def test_post_with_retry(self, mocker: MockerFixture) -> None:
+        """Test transient 429/503 responses are retried until success."""
+        service = OpenAIService()
+        sleep = mocker.patch("asyncio.sleep")
+        statuses = iter([429, 503, 200])
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), headers={"Retry-After": "3"})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            response = await service._post_with_retry(client, "https://test/chat")
+
+        assert response.status_code == 200
+        assert sleep.call_count == 2
+        assert all(call.args[0] >= 3 for call in sleep.call_args_list)
+
+    async def test_post_with_retry_permanent_error(self, mocker: MockerFixture) -> None:
+        """Test permanent errors are returned without retrying."""
+        service = OpenAIService()
+        sleep = mocker.patch("asyncio.sleep")
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda _request: httpx.Response(401))
+        ) as client:
+            response = await service._post_with_retry(client, "https://test/chat")
+
+        assert response.status_code == 401
+        sleep.assert_not_called()
+
+    async def test_post_with_retry_exhausted(self, mocker: MockerFixture) -> None:
+        """Test the last response is returned once all attempts are used."""
+        service = OpenAIService()
+        mocker.patch("asyncio.sleep")
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(503)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            response = await service._post_with_retry(
+                client, "https://test/chat", max_attempts=3
+            )
+
+        assert response.status_code == 503
+        assert len(requests) == 3
+
+    async def test_post_with_retry_transport_error(self, mocker: MockerFixture) -> None:
+        """Test a transport error on the last attempt propagates."""
+        service = OpenAIService()
+        sleep = mocker.patch("asyncio.sleep")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(httpx.ConnectError):
+                await service._post_with_retry(
+                    client, "https://test/chat", max_attempts=2
+                )
+
+        assert sleep.call_count == 1
+
+    async def test_http_client_reused(self) -> None:
+        """Test requests on one event loop share a pooled HTTP client."""
+        service = OpenAIService()
+
+        client = service._get_client()
+
+        assert service._get_client() is client
+        await service.aclose()
+        assert client.is_closed
+        assert service._get_client() is not client
+        await service.aclose()
+
+    def test_http_clients_of_closed_loops_discarded(self) -> None:
+        """Test clients bound to a closed event loop are not kept around."""
+        service = OpenAIService()
+
+        async def get_client() -> httpx.AsyncClient:
+            return service._get_client()
+
+        old_loop = asyncio.new_event_loop()
+        old_loop.run_until_complete(get_client())
+        old_loop.close()
+        new_loop = asyncio.new_event_loop()
+        try:
+            new_loop.run_until_complete(get_client())
+            assert list(service._clients) == [new_loop]
+            new_loop.run_until_complete(service.aclose())
+        finally:
+            new_loop.close()
+
+    async def test_aclose_closes_clients_of_all_loops(self) -> None:
+        """Test aclose() also closes clients opened on another thread's loop."""
+        service = OpenAIService()
+
+        async def get_client() -> httpx.AsyncClient:
+            return service._get_client()
+
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever)
+        thread.start()
+        try:
+            other_client = asyncio.run_coroutine_threadsafe(
+                get_client(), other_loop
+            ).result()
+            client = service._get_client()
+
+            await service.aclose()
+
+            assert client.is_closed
+            assert other_client.is_closed
+            assert not service._clients
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+
+    async def test_close_services(self) -> None:
+        """Test closing the shared services closes their pooled HTTP clients."""
+        service = ModelFactory.create_text_processor("gpt-4o-mini")
+        assert isinstance(service, OpenAIService)
+        client = service._get_client()
+
+        await ModelFactory.close_services()
+
+        assert client.is_closed
+        assert asyncio.get_running_loop() not in service._clients
 
 
 class TestMockSupabaseService:
     """Test MockSupabaseService."""
 
-    @pytest.mark.asyncio
-    async def test_create_job_record(self) -> None:
+    async def test_create_job_record(self, fresh_supabase: MockSupabaseService) -> None:
         """Test job record creation."""
-        service = MockSupabaseService()
+        service = fresh_supabase
 
         job_data = {
             "user_id": "test_user",
@@ -185,18 +339,17 @@ class TestMockSupabaseService:
         job_id = await service.create_job_record(job_data)
 
         assert isinstance(job_id, str)
-        assert len(job_id) > 0
+        assert job_id
 
         # Should be stored in mock database
-        assert job_id in service.jobs_db
-        stored_job = service.jobs_db[job_id]
+        stored_job = service.jobs_db.get(job_id)
+        assert stored_job is not None
         assert stored_job["user_id"] == "test_user"
         assert stored_job["status"] == "pending"
 
-    @pytest.mark.asyncio
-    async def test_update_job_status(self) -> None:
+    async def test_update_job_status(self, fresh_supabase: MockSupabaseService) -> None:
         """Test job status update."""
-        service = MockSupabaseService()
+        service = fresh_supabase
 
         # Create job first
         job_id = await service.create_job_record({"status": "pending"})
@@ -209,13 +362,11 @@ class TestMockSupabaseService:
         assert stored_job["progress"] == 50
         assert "updated_at" in stored_job
 
-    @pytest.mark.asyncio
-    async def test_get_job(self) -> None:
+    async def test_get_job(
+        self, prepopulated_supabase: tuple[MockSupabaseService, str]
+    ) -> None:
         """Test job retrieval."""
-        service = MockSupabaseService()
-
-        # Create job
-        job_id = await service.create_job_record({"user_id": "test_user"})
+        service, job_id = prepopulated_supabase
 
         # Retrieve job
         job = await service.get_job(job_id)
@@ -228,10 +379,11 @@ class TestMockSupabaseService:
         non_existent = await service.get_job("fake_id")
         assert non_existent is None
 
-    @pytest.mark.asyncio
-    async def test_check_user_quota(self) -> None:
+    async def test_check_user_quota(
+        self, prepopulated_supabase: tuple[MockSupabaseService, str]
+    ) -> None:
         """Test user quota check."""
-        service = MockSupabaseService()
+        service, _ = prepopulated_supabase
 
         quota = await service.check_user_quota("test_user")
 
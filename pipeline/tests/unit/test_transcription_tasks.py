@@ -0,0 +1,140 @@
+"""Test transcription tasks."""
+
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from shepherd_pipeline.services.llm_provider.schema import (
+    AudioChunk,
+    CorrectionResult,
+    TranscriptionResult,
+)
+from shepherd_pipeline.services.model_factory import ModelFactory
+from shepherd_pipeline.tasks.transcription_tasks import (
+    correct_transcription,
+    transcribe_audio_chunk,
+)
+from shepherd_pipeline.utils import artifact_manager
+
+
+@pytest.fixture
+def artifacts_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the artifact manager at a temporary directory."""
+    monkeypatch.setattr(artifact_manager, "ARTIFACTS_DIR", tmp_path)
+    return tmp_path
+
+
+def _chunk(source_file: str, file_path: str) -> AudioChunk:
+    """First ten-minute chunk cut from source_file."""
+    return AudioChunk(
+        chunk_id="chunk_0",
+        start_time=0.0,
+        end_time=600.0,
+        file_path=file_path,
+        duration=600.0,
+        source_file=source_file,
+    )
+
+
+class TestTranscribeAudioChunk:
+    """Test transcribe_audio_chunk."""
+
+    # Tasks run outside a flow here, so Prefect has no flow run to log to
+    @pytest.mark.filterwarnings("ignore:Logger 'prefect.task_runs':UserWarning")
+    async def test_cache_is_per_source(
+        self, artifacts_dir: Path, mocker: MockerFixture
+    ) -> None:
+        """Test chunks of different sources with the same time range don't share
+        a cached transcription, while the same chunk is served from the cache."""
+
+        async def transcribe(file_path: str, language: str) -> TranscriptionResult:
+            return TranscriptionResult(
+                raw_text=f"transcript of {file_path}",
+                language=language,
+                model="voxtral-mini-latest",
+            )
+
+        service = ModelFactory.create_transcription_service("voxtral-mini-latest")
+        transcribe_audio = mocker.patch.object(
+            service, "transcribe_audio", side_effect=transcribe
+        )
+        # Every download is saved as audio.mp3, so chunks of different videos
+        # end up in the same chunk folder
+        chunks_dir = artifacts_dir / "chunks" / "10min" / "audio"
+        first = _chunk(
+            str(artifacts_dir / "downloads" / "first" / "audio.mp3"),
+            str(chunks_dir / "chunk_a_0.mp3"),
+        )
+        second = _chunk(
+            str(artifacts_dir / "downloads" / "second" / "audio.mp3"),
+            str(chunks_dir / "chunk_b_0.mp3"),
+        )
+
+        first_result = await transcribe_audio_chunk(first, "voxtral-mini-latest", "en")
+        second_result = await transcribe_audio_chunk(
+            second, "voxtral-mini-latest", "en"
+        )
+        cached_result = await transcribe_audio_chunk(first, "voxtral-mini-latest", "en")
+
+        assert first_result.raw_text == f"transcript of {first.file_path}"
+        assert second_result.raw_text == f"transcript of {second.file_path}"
+        assert cached_result.raw_text == first_result.raw_text
+        assert transcribe_audio.call_count == 2
+
+    # Tasks run outside a flow here, so Prefect has no flow run to log to
+    @pytest.mark.filterwarnings("ignore:Logger 'prefect.task_runs':UserWarning")
+    async def test_mock_results_not_cached(self, artifacts_dir: Path) -> None:
+        """Test mock transcriptions are not written to the cache."""
+        chunk = _chunk(
+            str(artifacts_dir / "audio.mp3"), str(artifacts_dir / "chunk_0.mp3")
+        )
+
+        await transcribe_audio_chunk(chunk, "mock-model", "en")
+
+        assert not (artifacts_dir / "transcription_cache").exists()
+
+
+class TestCorrectTranscription:
+    """Test correct_transcription."""
+
+    # Tasks run outside a flow here, so Prefect has no flow run to log to
+    @pytest.mark.filterwarnings("ignore:Logger 'prefect.task_runs':UserWarning")
+    async def test_cached(self, artifacts_dir: Path, mocker: MockerFixture) -> None:
+        """Test the same text is only corrected once."""
+        service = ModelFactory.create_text_processor("mistral-small-latest")
+        correct_text = mocker.patch.object(
+            service,
+            "correct_text",
+            return_value=CorrectionResult(
+                original_text="測試",
+                corrected_text="測試。",
+                language="zh-TW",
+                model="mistral-small-latest",
+            ),
+        )
+        transcription = TranscriptionResult(
+            raw_text="測試", language="zh-TW", model="voxtral-mini-latest"
+        )
+
+        first = await correct_transcription(
+            transcription, "zh-TW", "mistral-small-latest"
+        )
+        second = await correct_transcription(
+            transcription, "zh-TW", "mistral-small-latest"
+        )
+
+        assert second == first
+        assert correct_text.call_count == 1
+
+    # Tasks run outside a flow here, so Prefect has no flow run to log to
+    @pytest.mark.filterwarnings("ignore:Logger 'prefect.task_runs':UserWarning")
+    async def test_mock_results_not_cached(self, artifacts_dir: Path) -> None:
+        """Test mock corrections are not written to the cache."""
+        transcription = TranscriptionResult(
+            raw_text="測試", language="zh-TW", model="mock-model"
+        )
+
+        await correct_transcription(transcription, "zh-TW", "mock-model")
+
+        assert not (artifacts_dir / "correction_cache").exists()
@@ -5,8 +5,11 @@ import pytest
 from shepherd_pipeline.services.translation_service import (
     OPENCC_AVAILABLE,
     ChineseTranslationService,
+    get_translation_service,
 )
 
+pytestmark = pytest.mark.usefixtures("warm_opencc")
+
 
 class TestChineseTranslationService:
     """Test ChineseTranslationService."""
@@ -42,6 +45,16 @@ class TestChineseTranslationService:
         assert service.to_traditional_chinese("") == ""
         assert service.to_traditional_chinese("   ") == "   "
 
+    @pytest.mark.skipif(not OPENCC_AVAILABLE, reason="OpenCC not available")
+    def test_to_traditional_chinese_already_traditional(self) -> None:
+        """Test traditional text is kept unless s2tw would change it."""
+        service = ChineseTranslationService()
+
+        traditional_text = "關於神的恩典的見證"
+        assert service.to_traditional_chinese(traditional_text) == traditional_text
+        # Phrase conversions still apply to otherwise traditional text
+        assert service.to_traditional_chinese("我不了解") == "我不瞭解"
+
     def test_to_traditional_chinese_mixed_content(self) -> None:
         """Test conversion of mixed Chinese and other content."""
         service = ChineseTranslationService()
@@ -55,38 +68,22 @@ class TestChineseTranslationService:
         assert "2024" in result
         assert len(result) >= len(mixed_text)  # Might be slightly longer
 
-    def test_detect_and_convert_simplified(self) -> None:
-        """Test detection and conversion of simplified Chinese."""
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            # Simplified Chinese is converted
+            ("这个国家的发展", "這個國家的發展"),
+            # Traditional Chinese is only standardized to Taiwan format
+            ("這個國家的發展", "這個國家的發展"),
+            # English-only text is left unchanged
+            ("This is English text only", "This is English text only"),
+        ],
+    )
+    def test_detect_and_convert(self, text: str, expected: str) -> None:
+        """Test detection and conversion to Traditional Chinese (Taiwan)."""
         service = ChineseTranslationService()
 
-        # Text with obvious simplified characters
-        simplified_text = "这个国家的发展"
-        result = service.detect_and_convert(simplified_text)
-
-        # Should be converted
-        assert result != simplified_text
-
-    def test_detect_and_convert_traditional(self) -> None:
-        """Test detection and standardization of traditional Chinese."""
-        service = ChineseTranslationService()
-
-        # Text with traditional characters
-        traditional_text = "這個國家的發展"
-        result = service.detect_and_convert(traditional_text)
-
-        # Should be standardized to Taiwan format
-        assert isinstance(result, str)
-        assert len(result) >= len(traditional_text)
-
-    def test_detect_and_convert_english_only(self) -> None:
-        """Test handling of English-only text."""
-        service = ChineseTranslationService()
-
-        english_text = "This is English text only"
-        result = service.detect_and_convert(english_text)
-
-        # Should remain unchanged
-        assert result == english_text
+        assert service.detect_and_convert(text) == expected
 
     @pytest.mark.skipif(not OPENCC_AVAILABLE, reason="OpenCC not available")
     def test_conversion_accuracy_with_opencc(self) -> None:
@@ -115,6 +112,23 @@ class TestChineseTranslationService:
         # Should have logger
         assert hasattr(service, "logger")
 
+    @pytest.mark.skipif(not OPENCC_AVAILABLE, reason="OpenCC not available")
+    def test_converters_shared(self) -> None:
+        """Test OpenCC converters are loaded once and shared, not per instance."""
+        service = ChineseTranslationService()
+        other = ChineseTranslationService()
+
+        assert service.s2tw is other.s2tw
+        assert service.t2tw is other.t2tw
+        assert service.s2tw is service.s2tw
+
+    def test_get_translation_service_shared(self) -> None:
+        """Test the module-level accessor returns one shared instance."""
+        service = get_translation_service()
+
+        assert isinstance(service, ChineseTranslationService)
+        assert get_translation_service() is service
+
     def test_long_text_conversion(self) -> None:
         """Test conversion of longer text passages."""
         service = ChineseTranslationService()